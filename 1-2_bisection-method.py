@@ -1,8 +1,10 @@
-import sympy as sp
+from expression_cache import compile_expression
+from root_finding import batch_bisection, find_brackets
 
 # Bisection method implementation
 def bisection_method(func, a, b, tolerance=1e-7, max_iter=100):
-    if func(a) * func(b) >= 0:
+    func_a = func(a)
+    if func_a * func(b) >= 0:
         print("The bisection method cannot be applied because the signs of func(a) and func(b) are not opposite.")
         return None, 0, 0
 
@@ -14,7 +16,7 @@ def bisection_method(func, a, b, tolerance=1e-7, max_iter=100):
         # Ternary operations to update bounds and check for root
         if func_c == 0: 
             return c, iteration, (b - a) / 2
-        a, b = (a, c) if func_c * func(a) < 0 else (c, b)
+        a, b, func_a = (a, c, func_a) if func_c * func_a < 0 else (c, b, func_c)
         iteration += 1
 
     error_bound = (b - a) / 2
@@ -22,17 +24,13 @@ def bisection_method(func, a, b, tolerance=1e-7, max_iter=100):
 
 # Function to parse user input into a sympy function
 def parse_function(expression):
-    x = sp.symbols('x')
-    expr = sp.sympify(expression)
-    return sp.lambdify(x, expr, "numpy")
+    return compile_expression(expression).func
 
 # Function to find a suitable interval for the Bisection method
 def find_interval_for_bisection(func, x_start=-10, x_end=10, step_size=0.1):
-    a, b = x_start, x_start + step_size
-    while b <= x_end:
-        if func(a) * func(b) < 0:
-            return a, b
-        a, b = a + step_size, b + step_size
+    a, b, _ = find_brackets(func, x_start, x_end, step_size=step_size)
+    if a.size:
+        return float(a[0]), float(b[0])
 
     print("No sign change found within the specified range.")
     return None, None
@@ -49,7 +47,8 @@ if __name__ == "__main__":
     print("\nChoose how to determine the interval:")
     print("1. Input interval manually")
     print("2. Automatically find interval")
-    choice = input("Enter your choice (1 or 2): ").strip()
+    print("3. Automatically find all roots in [-10, 10]")
+    choice = input("Enter your choice (1, 2 or 3): ").strip()
     
     if choice == '1':
         # User inputs the interval manually
@@ -65,6 +64,20 @@ if __name__ == "__main__":
             print("Couldn't find a suitable interval for the Bisection Method.")
             exit()
         print(f"Found suitable interval for bisection method: [{a}, {b}]")
+    elif choice == '3':
+        # Every bracket on the grid is solved together by the batch engine
+        a, b, touching = find_brackets(func)
+        tolerance = float(input("Enter the desired tolerance (e.g., 0.1e-3): ") or 0.1e-3)
+        roots, iterations, error_bounds = batch_bisection(func, a, b, tolerance)
+        if roots.size == 0 and touching.size == 0:
+            print("No roots found within the specified range.")
+        for root, iteration, error_bound in zip(roots, iterations, error_bounds):
+            print(f"\nRoot found using Bisection Method: {root:.4f}")
+            print(f"Number of iterations: {iteration}")
+            print(f"Error bound: {error_bound:.6f}")
+        for root in touching:
+            print(f"\nRoot found on the scan grid (no sign change): {root:.4f}")
+        exit()
     else:
         print("Invalid choice. Exiting program.")
         exit()
@@ -1,15 +1,17 @@
 import numpy as np
 import sympy as sp
 from tabulate import tabulate
+from tracing import IterationTrace, render_trace
+from iterative_solvers import ITERATIVE_METHODS, compare_iterative_methods, diagonal_dominance
 
 def is_diagonally_dominant(A):
-    return all(abs(A[i, i]) >= sum(abs(A[i, j]) for j in range(len(A)) if j != i) for i in range(len(A)))
+    return diagonal_dominance(A)["weak"]
 def generate_random_system(n, min_val=1, max_val=10):
     while True:
         A = np.random.uniform(min_val, max_val, (n, n))
         b = np.random.uniform(min_val, max_val, n)
-        for i in range(n):
-            A[i, i] = sum(abs(A[i, j]) for j in range(n) if j != i) + np.random.uniform(1, max_val)
+        np.fill_diagonal(A, 0)
+        np.fill_diagonal(A, np.abs(A).sum(axis=1) + np.random.uniform(1, max_val, n))
         if is_diagonally_dominant(A):
             return A, b
 def format_matrix(A, b=None):
@@ -22,19 +24,17 @@ def get_float_input(prompt, default):
 def get_int_input(prompt, default):
     val = input(prompt)
     return int(val) if val.strip() != "" else default
-def solve_system(A, b, method, tol=1e-6, max_iter=100):
-    # Solve Ax = b using Jacobi or Gauss-Seidel method with detailed output.
+def solve_system(A, b, method, tol=1e-6, max_iter=100, trace=None):
+    # Solve Ax = b using Jacobi or Gauss-Seidel method; per-iteration records go to the optional trace.
     n, x = len(b), np.zeros(len(b))
-    print(f"\nSolving using {method} Method...")
-    headers = ["Iteration"] + [f"x{i+1}" for i in range(n)] + ["Error"]
-    iterations = []
     if method == "Jacobi":
         D = np.diag(A)
         R = A - np.diagflat(D)
         for k in range(max_iter):
             x_new = (b - np.dot(R, x)) / D
             error = np.linalg.norm(x_new - x, ord=np.inf)
-            iterations.append([k+1] + list(np.round(x_new, 5)) + [f"{error:.6e}"])
+            if trace is not None:
+                trace(k+1, x_new, error)
             if error < tol:
                 break
             x = x_new
@@ -45,12 +45,15 @@ def solve_system(A, b, method, tol=1e-6, max_iter=100):
                 s1, s2 = np.dot(A[i, :i], x_new[:i]), np.dot(A[i, i+1:], x[i+1:])
                 x_new[i] = (b[i] - s1 - s2) / A[i, i]
             error = np.linalg.norm(x_new - x, ord=np.inf)
-            iterations.append([k+1] + list(np.round(x_new, 5)) + [f"{error:.6e}"])
+            if trace is not None:
+                trace(k+1, x_new, error)
             if error < tol:
                 break
             x = x_new
-    print("\nIteration Process:")
-    print(tabulate(iterations, headers=headers, tablefmt="fancy_grid"))
+    else:
+        # Whole-array sparse kernels share the same convergence test and trace records
+        x_new, _, converged = ITERATIVE_METHODS[method](A, b, tol=tol, max_iter=max_iter, trace=trace)
+        error = 0.0 if converged else np.inf
     if error >= tol:
         print("\nIterative method did not converge within the max iterations.")
     return x_new
@@ -78,18 +81,38 @@ def solve_linear_system():
     if np.any(np.diag(A) == 0):
         print("Error: Matrix contains zero diagonal elements. Cannot proceed.")
         return
+    dominance = diagonal_dominance(A)
+    kind = "strictly" if dominance["strict"] else ("weakly" if dominance["weak"] else "not")
+    print(f"\nThe matrix is {kind} diagonally dominant "
+          f"(worst margin {dominance['worst_margin']:.4g} in row {dominance['worst_row'] + 1}).")
     tol = get_float_input("\nEnter tolerance (default 1e-6): ", 1e-6)
     max_iter = get_int_input("Enter max iterations (default 100): ", 100)
     while True:
         print("\nChoose a method to solve:")
         print("1. Jacobi Method")
         print("2. Gauss-Seidel Method")
-        method_choice = input("Enter choice (1 or 2): ").strip()
-        method = {"1": "Jacobi", "2": "Gauss-Seidel"}.get(method_choice)
+        extra_methods = list(ITERATIVE_METHODS)
+        for i, name in enumerate(extra_methods, start=3):
+            print(f"{i}. {name}")
+        print(f"{len(extra_methods) + 3}. Compare all methods (iterations and wall time)")
+        method_choice = input(f"Enter choice (1-{len(extra_methods) + 3}): ").strip()
+        if method_choice == str(len(extra_methods) + 3):
+            rows = compare_iterative_methods(A, b, tol, max_iter)
+            print(tabulate(rows, headers=["Method", "Iterations", "Converged", "Wall time", "Residual"],
+                           tablefmt="fancy_grid"))
+            continue
+        method = {"1": "Jacobi", "2": "Gauss-Seidel",
+                  **{str(i): name for i, name in enumerate(extra_methods, start=3)}}.get(method_choice)
         if not method:
             print("Invalid method choice! Exiting.")
             return
-        solution = solve_system(A, b, method, tol, max_iter)
+        print(f"\nSolving using {method} Method...")
+        trace = IterationTrace(max_iter)
+        solution = solve_system(A, b, method, tol, max_iter, trace=trace)
+        print("\nIteration Process:")
+        headers = ["Iteration"] + [f"x{i+1}" for i in range(n)] + ["Error"]
+        print(render_trace([(k, np.round(x_k, 5), f"{error:.6e}") for k, x_k, error in trace.records()],
+                           headers, floatfmt="g"))
         print("\n Final Approximate Solution (Iterative Method):")
         print(tabulate([solution], headers=[f"x{i+1}" for i in range(n)], tablefmt="fancy_grid"))
         print("\n Direct Method Solution (Verification):")
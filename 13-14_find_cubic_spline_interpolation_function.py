@@ -1,47 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from splines import CubicSpline
 
-def cubic_spline(x, y, query_points):
-    n = len(x) - 1  # Number of intervals
-    h = np.diff(x)  # Interval widths
-
-    # Step 1: Solve for second derivatives (M)
-    A = np.zeros((n + 1, n + 1))  # Coefficient matrix
-    b = np.zeros(n + 1)           # Right-hand side vector
-
-    # Natural spline boundary conditions
-    A[0, 0] = 1
-    A[n, n] = 1
-
-    # Fill the tridiagonal matrix for interior points
-    for i in range(1, n):
-        A[i, i - 1] = h[i - 1]
-        A[i, i] = 2 * (h[i - 1] + h[i])
-        A[i, i + 1] = h[i]
-        b[i] = 3 * ((y[i + 1] - y[i]) / h[i] - (y[i] - y[i - 1]) / h[i - 1])
-
-    # Solve for second derivatives (M)
-    M = np.linalg.solve(A, b)
-
-    # Step 2: Compute spline coefficients for each interval
-    splines = []
-    for i in range(n):
-        a = y[i]
-        b = (y[i + 1] - y[i]) / h[i] - h[i] * (2 * M[i] + M[i + 1]) / 3
-        c = M[i] / 2
-        d = (M[i + 1] - M[i]) / (3 * h[i])
-        splines.append((a, b, c, d))
-
-    # Step 3: Evaluate the spline at query points
-    def evaluate_spline(xi):
-        for i in range(n):
-            if x[i] <= xi <= x[i + 1]:
-                a, b, c, d = splines[i]
-                dx = xi - x[i]
-                return a + b * dx + c * dx**2 + d * dx**3
-        raise ValueError("Query point out of bounds.")
-
-    interpolated_values = np.array([evaluate_spline(xi) for xi in query_points])
+def cubic_spline(x, y, query_points, bc_type="natural"):
+    # Step 1: Fit once; coefficients (a, b, c, d) of every interval from one O(n) tridiagonal solve
+    spline = CubicSpline(x, y, bc_type)
+    splines = [tuple(row) for row in spline.coefficients]
+
+    # Step 2: Evaluate all query points at once (binary-search interval lookup + Horner's rule)
+    interpolated_values = spline(query_points)
 
     return splines, interpolated_values
 
@@ -1,5 +1,10 @@
 import random
-from sympy import symbols, sympify, lambdify
+import time
+import numpy as np
+from tabulate import tabulate
+from expression_cache import compile_expression
+from quadrature import adaptive_gauss_kronrod, batch_integrate, gauss_legendre, romberg
+from tracing import IterationTrace, render_trace
 from scipy.integrate import quad
 
 def get_input_or_random(prompt, use_random=False, min_val=-10, max_val=10):
@@ -12,11 +17,27 @@ def get_user_input(prompt):
             return float(value)
         except ValueError as e:
             print(f"Invalid input. Please enter a valid number. Error: {e}")
-def parse_function(function_str):
+def get_int_or_default(prompt, default):
+    value = input(prompt).strip()
     try:
-        x = symbols('x')
-        func = sympify(function_str)
-        return lambdify(x, func, "numpy")
+        return int(value) if value else default
+    except ValueError:
+        print(f"Invalid input. Using the default value {default}.")
+        return default
+def compare_with_quad(func, a, b, order=10, panels=4):
+    reference, _, info = quad(func, a, b, epsabs=1e-13, epsrel=1e-13, full_output=1)
+    rows = [["scipy quad (QUADPACK)", reference, info["neval"], 0.0]]
+    for name, (result, evaluations) in (("Gauss-Legendre", gauss_legendre(func, a, b, order, panels)),
+                                        ("Romberg", romberg(func, a, b))):
+        rows.append([name, result, evaluations, abs(result - reference)])
+    result, _, evaluations = adaptive_gauss_kronrod(func, a, b)
+    rows.append(["Adaptive Gauss-Kronrod", result, evaluations, abs(result - reference)])
+    return rows
+def parse_function(function_str, parameters=()):
+    try:
+        # Vectorized: integrators evaluate whole arrays of nodes in one call; extra parameters
+        # follow x as arguments, e.g. for batch_integrate(func, a, b, params=(k,))
+        return compile_expression(function_str, ("x",) + tuple(parameters)).vectorized
     except Exception as e:
         print(f"Error parsing the function: {e}")
         return None
@@ -42,23 +63,58 @@ if __name__ == "__main__":
         print("------------------------------------------------")
         print("1. Perform Gaussian Quadrature Integration")
         print("2. Perform Romberg Integration")
-        print("3. Exit")
+        print("3. Compare with scipy quad (function evaluations)")
+        print("4. Batch integration: running integral from a to many upper limits")
+        print("5. Perform globally adaptive Gauss-Kronrod Integration")
+        print("6. Exit")
         method = input("Enter your choice: ").strip()
         if method == '1':
-            print("\nUsing Gaussian Quadrature Method...")
+            print("\nUsing Gaussian Quadrature Method (Gauss-Legendre)...")
+            order = get_int_or_default("Enter the number of nodes per panel (default 5): ", 5)
+            panels = get_int_or_default("Enter the number of panels (default 1): ", 1)
             try:
-                result, _ = quad(func, a, b)
-                print(f"Result using Gaussian Quadrature: {result:.3f}\n")
+                result, evaluations = gauss_legendre(func, a, b, order, panels)
+                print(f"Result using Gaussian Quadrature: {result:.3f} ({evaluations} function evaluations)\n")
             except Exception as e:
                 print(f"Error with integration: {e}")
         elif method == '2':
-            print("\nUsing Romberg Integration Method (via quad with higher accuracy)...")
+            print("\nUsing Romberg Integration Method...")
             try:
-                result, _ = quad(func, a, b, epsrel=1e-8)
-                print(f"Result using Romberg Integration: {result:.3f}\n")
+                result, evaluations = romberg(func, a, b)
+                print(f"Result using Romberg Integration: {result:.3f} ({evaluations} function evaluations)\n")
             except Exception as e:
                 print(f"Error with integration: {e}")
         elif method == '3':
+            try:
+                rows = compare_with_quad(func, a, b)
+                print(tabulate(rows, headers=["Method", "Result", "Evaluations", "|Difference from quad|"],
+                               tablefmt="fancy_grid", floatfmt=".10g"))
+            except Exception as e:
+                print(f"Error with integration: {e}")
+        elif method == '4':
+            count = get_int_or_default("Enter the number of upper limits (default 10000): ", 10000)
+            upper_limits = np.linspace(a, b, max(count, 1) + 1)[1:]
+            start = time.perf_counter()
+            integrals, errors, evaluations = batch_integrate(func, a, upper_limits)
+            elapsed = time.perf_counter() - start
+            shown = list(range(min(5, count))) + list(range(max(count - 5, 5), count))
+            print(tabulate([[upper_limits[i], integrals[i], errors[i]] for i in shown],
+                           headers=["Upper limit", "Integral from a", "Error estimate"], tablefmt="fancy_grid", floatfmt=".8g"))
+            print(f"{count} integrals with {evaluations} function evaluations in {elapsed * 1e3:.2f} ms\n")
+        elif method == '5':
+            print("\nUsing globally adaptive Gauss-Kronrod (G7-K15) Method...")
+            budget = get_int_or_default("Enter the function evaluation budget (default 100000): ", 100000)
+            trace = IterationTrace(capacity=1000)
+            try:
+                result, error, evaluations = adaptive_gauss_kronrod(func, a, b, max_evaluations=budget, trace=trace)
+                print(f"Result using adaptive Gauss-Kronrod: {result:.3f} (error estimate {error:.2e}, "
+                      f"{evaluations} function evaluations)\n")
+                if len(trace) and input("Show the refinement trace? (y/n): ").strip().lower() in ('y', 'yes'):
+                    print(render_trace(trace.records(), headers=["Round", "Integral", "Error estimate", "Subintervals",
+                                                                 "Evaluations"], floatfmt=".10g"))
+            except Exception as e:
+                print(f"Error with integration: {e}")
+        elif method == '6':
             print("\nGoodBye.")
             print("------------------------------------------------")
             break
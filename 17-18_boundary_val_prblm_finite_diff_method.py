@@ -1,6 +1,7 @@
 import random
 import numpy as np
 import matplotlib.pyplot as plt
+from banded import TridiagonalMatrix
 
 def get_input_or_random(prompt, use_random=False, min_val=-10, max_val=10):
     return (random.uniform(-1, 1) if 'boundary' in prompt.lower() else
@@ -19,10 +20,10 @@ def solve_bvp(N, a=0, b=1, alpha=0, beta=0):
     x = np.linspace(a, b, N + 2)
     f = -np.pi**2 * np.sin(np.pi * x)
     f[0], f[-1] = alpha, beta
-    A = np.diag(-2 * np.ones(N)) + np.diag(np.ones(N-1), 1) + np.diag(np.ones(N-1), -1)
-    A /= h**2
+    # The second-difference operator is tridiagonal: keep only its three bands
+    A = TridiagonalMatrix(np.full(N-1, 1 / h**2), np.full(N, -2 / h**2), np.full(N-1, 1 / h**2))
     b = f[1:-1]
-    y = np.linalg.solve(A, b)
+    y = A.solve(b)
     full_y = np.concatenate(([alpha], y, [beta]))
     return x, full_y
 
@@ -1,5 +1,5 @@
-import sympy as sp
-import numpy as np
+from expression_cache import compile_expression
+from root_finding import brent_method, find_brackets
 
 # Secant Method implementation
 def secant_method(func, x0, x1, tolerance=1e-7, max_iter=100):
@@ -28,36 +28,28 @@ def regula_falsi_method(func, a, b, tolerance=1e-7, max_iter=100):
 
 # Function to parse the equation into a sympy function
 def parse_function(expression):
-    x = sp.symbols('x')
-    expr = sp.sympify(expression)
-    return sp.lambdify(x, expr, "numpy")
+    return compile_expression(expression).func
 
 # Function to find a suitable interval for the method
 def find_interval_for_method(func, x_start=-10, x_end=10, step_size=0.1):
-    a, b = x_start, x_start + step_size
-    while b <= x_end:
-        if func(a) * func(b) < 0:
-            return a, b
-        a, b = a + step_size, b + step_size
+    a, b, _ = find_brackets(func, x_start, x_end, step_size=step_size)
+    if a.size:
+        return float(a[0]), float(b[0])
     print("No sign change found within the specified range.")
     return None, None
 
 # Function to get initial guesses for methods
 def smart_initial_guesses(func, x_start=-10, x_end=10, step_size=0.1):
-    x0, x1 = None, None
-    for x in np.arange(x_start, x_end, step_size):
-        # Sign change detected using ternary-like logic
-        if func(x) * func(x + step_size) < 0:  
-            x0, x1 = x, x + step_size
-            break
-    return (x0, x1) if x0 is not None and x1 is not None else (None, None)
+    x0, x1, _ = find_brackets(func, x_start, x_end, step_size=step_size)
+    return (float(x0[0]), float(x1[0])) if x0.size else (None, None)
 
 # Display method options
 def display_menu():
     print("\nChoose a method for root finding:")
     print("1. Secant Method")
     print("2. Regula Falsi Method")
-    print("3. Exit")
+    print("3. Brent's Method")
+    print("4. Exit")
 
 if __name__ == "__main__":
     equation_str = input("Enter the equation function f(x): (e.g., 'x**3 + x**2 + x + 7'): ")
@@ -89,6 +81,12 @@ if __name__ == "__main__":
                 print(f"Number of iterations: {iterations}")
                 
             elif method_choice == '3':
+                root, iterations, evaluations = brent_method(func, a, b, tolerance)
+                print(f"\nRoot found using Brent's Method: {root:.4f}") if root is not None else print("Root not found.")
+                print(f"Number of iterations: {iterations}")
+                print(f"Number of function evaluations: {evaluations}")
+
+            elif method_choice == '4':
                 print("Program successfully Terminated.")
                 break
             
@@ -1,4 +1,6 @@
-import sympy as sp
+import numpy as np
+from expression_cache import compile_expression
+from root_finding import batch_newton
 
 def newton_raphson_method(func, func_prime, x0, tolerance=1e-7, max_iter=100):
     iteration = 0
@@ -20,9 +22,7 @@ def newton_raphson_method(func, func_prime, x0, tolerance=1e-7, max_iter=100):
     return x1, iteration
 
 def parse_function(expression):
-    x = sp.symbols('x')
-    expr = sp.sympify(expression)
-    func = sp.lambdify(x, expr, "numpy")
+    func = compile_expression(expression).func
     return func
 
 def find_initial_guess(func):
@@ -50,17 +50,22 @@ if __name__ == "__main__":
     # Parse the function f(x) from the input string
     func = parse_function(equation_str)
     
-    # Compute the derivative of the function
-    x = sp.symbols('x')
-    expr = sp.sympify(equation_str)
-    func_prime = sp.lambdify(x, sp.diff(expr, x), "numpy")
+    # Compute the derivative of the function (reuses the cached sympified expression)
+    func_prime = compile_expression(equation_str).derivative()
     
     tolerance = float(input("Enter the desired tolerance (default is 0.1e-3): ") or 0.1e-3)
     
     # Ask the user for the initial guess
-    x0_input = input("Enter the initial guess x0 (leave empty for automated guess): ")
+    x0_input = input("Enter the initial guess x0 (comma-separated for several, leave empty for automated guess): ")
     
-    if x0_input.strip():  # If the user enters a value
+    if "," in x0_input:
+        # Several guesses are solved together with the fused f/f' kernel
+        x0 = np.array([float(guess) for guess in x0_input.split(",")])
+        roots, iterations, converged = batch_newton(compile_expression(equation_str).newton_kernel, x0, tolerance)
+        for guess, root, iteration, ok in zip(x0, roots, iterations, converged):
+            print(f"\nx0 = {guess}: " + (f"root {root:.4f} after {iteration} iterations" if ok else "no convergence"))
+        exit()
+    elif x0_input.strip():  # If the user enters a value
         x0 = float(x0_input)
     else:
         # Automatically determine the initial guess x0
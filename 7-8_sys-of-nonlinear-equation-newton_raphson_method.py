@@ -1,8 +1,13 @@
 import sympy as sp
 import numpy as np
 import random
+from expression_cache import compile_expression
+from tabulate import tabulate
+from tracing import IterationTrace, render_trace
+from nonlinear_systems import (broyden_method, compare_system_methods, modified_newton_method, multi_start_solve,
+                               newton_raphson_method_sparse, parse_dense_system, parse_sparse_system)
 
-def newton_raphson_method_system(funcs, jacobian, x0, tolerance=1e-7, max_iter=100):
+def newton_raphson_method_system(funcs, jacobian, x0, tolerance=1e-7, max_iter=100, trace=None):
     iteration = 0
     x0 = np.array(x0, dtype=float)
     while iteration < max_iter:
@@ -17,8 +22,9 @@ def newton_raphson_method_system(funcs, jacobian, x0, tolerance=1e-7, max_iter=1
         # Check for convergence based on the residual (F_values) instead of just delta
         if np.linalg.norm(F_values) < tolerance:
             return x1, iteration
-        # Debug: Print the current guess values for each variable
-        print(f"Iteration {iteration + 1}: " + ", ".join([f"x{i+1} = {x1[i]}" for i in range(len(x1))]))
+        # Record the current guess values for each variable (rendered after the solve)
+        if trace is not None:
+            trace(iteration + 1, x1)
         x0 = x1
         iteration += 1
     print("Maximum iterations reached.")
@@ -27,17 +33,11 @@ def newton_raphson_method_system(funcs, jacobian, x0, tolerance=1e-7, max_iter=1
 def parse_system_of_equations(equations, vars):
     funcs = []
     for eq in equations:
-        funcs.append(sp.lambdify(vars, sp.sympify(eq), "numpy"))
+        funcs.append(compile_expression(eq, vars).func)
     return funcs
 
 def parse_jacobian(equations, vars):
-    jacobian = []
-    for eq in equations:
-        jacobian_row = []
-        for var in vars:
-            jacobian_row.append(sp.diff(sp.sympify(eq), var))
-        jacobian.append(jacobian_row)
-    jacobian_func = sp.lambdify(vars, jacobian, "numpy")
+    jacobian_func = compile_expression(equations, vars).jacobian
     return jacobian_func
 
 def generate_initial_guess(num_vars):
@@ -53,9 +53,6 @@ if __name__ == "__main__":
 
         vars = sp.symbols(f'x1:{num_equations + 1}')  # This generates x1, x2, ..., xn for n variables
         
-        funcs = parse_system_of_equations(equations, vars)
-        jacobian = parse_jacobian(equations, vars)
-        
         # Initial guess
         x0_input = input(f"Enter the initial guess (e.g., 'x1, x2, ..., xn'): ")
         if x0_input.strip():
@@ -65,9 +62,54 @@ if __name__ == "__main__":
             print(f"Auto-generated initial guess: {x0}")
         
         tolerance = float(input("Enter the desired tolerance (e.g., 0.1e-3): ") or 0.1e-3)
-        solution, iterations = newton_raphson_method_system(funcs, jacobian, x0, tolerance)
+        print("\nChoose a solver:")
+        print("1. Newton-Raphson Method")
+        print("2. Sparse Newton-Raphson Method (large systems)")
+        print("3. Modified Newton Method (reused LU factorization)")
+        print("4. Broyden's Method (good update)")
+        print("5. Broyden's Method (bad update)")
+        print("6. Compare methods 1, 3, 4 and 5")
+        print("7. Multi-start search for all distinct solutions (parallel)")
+        method_choice = input("Enter your choice [DEFAULT=1]: ").strip() or "1"
+        counters, method_name = None, "Newton-Raphson Method"
+        if method_choice == "7":
+            num_starts = int(input("Enter the number of random starting guesses [DEFAULT=64]: ") or 64)
+            # Roots are polished before merging, so distinct_tol can stay well below the residual tolerance
+            roots = multi_start_solve(equations, vars, num_starts, tolerance=tolerance, distinct_tol=1e-8)
+            print(f"Found {len(roots)} distinct solution(s):")
+            for root in roots:
+                print("  " + ", ".join(f"{value:.6f}" for value in root))
+            solution = None
+        elif method_choice == "2":
+            method_name = "Sparse Newton-Raphson Method"
+            residual, sparse_jacobian = parse_sparse_system(equations, vars)
+            solution, iterations = newton_raphson_method_sparse(residual, sparse_jacobian, x0, tolerance)
+        elif method_choice in ("3", "4", "5", "6"):
+            residual, dense_jacobian = parse_dense_system(equations, vars)
+            if method_choice == "3":
+                method_name = "Modified Newton Method"
+                solution, iterations, counters = modified_newton_method(residual, dense_jacobian, x0, tolerance)
+            elif method_choice == "6":
+                rows = compare_system_methods(residual, dense_jacobian, x0, tolerance)
+                print(tabulate(rows, headers=["Method", "Iterations", "Residual evals", "Jacobian evals",
+                                              "Factorizations", "Time"], tablefmt="fancy_grid"))
+                solution = None
+            else:
+                update = "good" if method_choice == "4" else "bad"
+                method_name = f"Broyden's Method ({update} update)"
+                solution, iterations, counters = broyden_method(residual, dense_jacobian, x0, tolerance, update=update)
+        else:
+            # The dense symbolic Jacobian is only built for the solvers that use it
+            funcs = parse_system_of_equations(equations, vars)
+            jacobian = parse_jacobian(equations, vars)
+            trace = IterationTrace()
+            solution, iterations = newton_raphson_method_system(funcs, jacobian, x0, tolerance, trace=trace)
+            print(render_trace(trace.records(), ["Iteration"] + [f"x{i+1}" for i in range(num_equations)],
+                               floatfmt=".10f"))
         
         if solution is not None:
             formatted_solution = [f"{sol:.6f}" for sol in solution]
-            print(f"Solution found using Newton-Raphson Method: {', '.join(formatted_solution)}")
+            print(f"Solution found using {method_name}: {', '.join(formatted_solution)}")
             print(f"Number of iterations: {iterations}")
+            if counters is not None:
+                print(f"Jacobian evaluations: {counters['jacobian_evaluations']}, factorizations: {counters['factorizations']}")
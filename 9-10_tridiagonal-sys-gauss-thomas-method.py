@@ -1,6 +1,8 @@
 import numpy as np
 from sympy import symbols, Matrix
 from tabulate import tabulate
+from tracing import IterationTrace
+from banded import TridiagonalMatrix
 
 def get_input(n, mode="manual"):
     """Get user input or generate random coefficients for a tridiagonal system."""
@@ -18,12 +20,9 @@ def get_input(n, mode="manual"):
     return a, b, c, d
 
 def display_matrix(n, a, b, c, d):
-    """Display the system as a tridiagonal matrix."""
-    matrix = [[b[i] if i == j else (a[j] if i == j+1 else (c[i] if i+1 == j else 0)) for j in range(n)] for i in range(n)]
-    table = [row + [d[i]] for i, row in enumerate(matrix)]
-    headers = ["a", "b", "c"][:n] + ["d"]
+    """Display the system as a tridiagonal matrix (large systems are shown truncated)."""
     print("\nTridiagonal System Representation:")
-    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+    print(TridiagonalMatrix(a, b, c).to_table(d))
 
 def symbolic_representation(n, a, b, c, d):
     """Show symbolic representation of the equations."""
@@ -33,7 +32,7 @@ def symbolic_representation(n, a, b, c, d):
                  for i in range(n)]
     print("\nSystem of Equations:\n" + "\n".join([f"  {eq}" for eq in equations]))
 
-def gauss_thomas(n, a, b, c, d):
+def gauss_thomas(n, a, b, c, d, trace=None):
     """Solve the tridiagonal system using the Gauss-Thomas method."""
     # Step 1: Forward Elimination
     c_star, d_star = np.zeros(n-1), np.zeros(n)
@@ -43,21 +42,31 @@ def gauss_thomas(n, a, b, c, d):
         c_star[i] = c[i] / denominator
         d_star[i] = (d[i] - a[i-1] * d_star[i-1]) / denominator
     d_star[n-1] = (d[n-1] - a[n-2] * d_star[n-2]) / (b[n-1] - a[n-2] * c_star[n-2])
-    print("\nForward Elimination Steps:")
-    for i in range(n-1):
-        print(f"  c*[{i+1}] = {c_star[i]:.6f},  d*[{i+1}] = {d_star[i]:.6f}")
-    print(f"  d*[{n}] = {d_star[n-1]:.6f}")
+    if trace is not None:
+        for i in range(n-1):
+            trace("forward", i+1, c_star[i], d_star[i])
+        trace("forward", n, None, d_star[n-1])
 
     # Step 2: Backward Substitution
     x = np.zeros(n)
     x[n-1] = d_star[n-1]
     for i in range(n-2, -1, -1):
         x[i] = d_star[i] - c_star[i] * x[i+1]
-    print("\nBackward Substitution Steps:")
-    for i in range(n-1, -1, -1):
-        print(f"  x[{i+1}] = {x[i]:.6f}")
+    if trace is not None:
+        for i in range(n-1, -1, -1):
+            trace("backward", i+1, x[i])
     return x
 
+def print_thomas_steps(records):
+    """Print the forward/backward steps recorded by gauss_thomas once the solve is done."""
+    forward = [record for record in records if record[0] == "forward"]
+    print("\nForward Elimination Steps:")
+    for _, i, c_value, d_value in forward:
+        print(f"  c*[{i}] = {c_value:.6f},  d*[{i}] = {d_value:.6f}" if c_value is not None else f"  d*[{i}] = {d_value:.6f}")
+    print("\nBackward Substitution Steps:")
+    for _, i, x_value in (record for record in records if record[0] == "backward"):
+        print(f"  x[{i}] = {x_value:.6f}")
+
 if __name__ == "__main__":
     # print("Solving a tridiagonal system using the Gauss-Thomas (Thomas) method.\n")
     n = int(input("Enter the number of equations (n): "))
@@ -65,6 +74,8 @@ if __name__ == "__main__":
     a, b, c, d = get_input(n, mode="manual" if choice == "1" else "random")
     display_matrix(n, a, b, c, d)
     symbolic_representation(n, a, b, c, d)
-    solution = gauss_thomas(n, a, b, c, d)
+    trace = IterationTrace(4 * n)
+    solution = gauss_thomas(n, a, b, c, d, trace=trace)
+    print_thomas_steps(trace.records())
     print("\nFinal Solution:")
     print(tabulate([[f"x[{i+1}]", f"{solution[i]:.6f}"] for i in range(n)], tablefmt="fancy_grid"))
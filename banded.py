@@ -0,0 +1,383 @@
+import operator
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import scipy.sparse as sps
+import scipy.sparse.linalg as spla
+from scipy.linalg import solve_banded
+from tabulate import tabulate
+
+# Single systems at least this long are solved with partitioned_thomas
+PARTITIONED_MIN_SIZE = 4096
+
+class ThomasFactor:
+    """Forward-sweep factors of one or many tridiagonal systems, reusable for any right-hand side.
+
+    Arrays are stored equation-major, i.e. shape (n, *batch), so each sweep step is one
+    contiguous whole-batch operation.
+    """
+    __slots__ = ("lower", "c_star", "inv_denominator")
+
+    def __init__(self, lower, c_star, inv_denominator):
+        self.lower = lower
+        self.c_star = c_star
+        self.inv_denominator = inv_denominator
+
+    @property
+    def n(self):
+        return self.inv_denominator.shape[0]
+
+    @property
+    def batch_shape(self):
+        return self.inv_denominator.shape[1:]
+
+def _thomas_factor(a, b, c):
+    # a and c have n-1 entries along axis 0, b has n
+    n = b.shape[0]
+    shape = np.broadcast_shapes(a.shape[1:], b.shape[1:], c.shape[1:])
+    c_star = np.empty((n - 1,) + shape)
+    inv_denominator = np.empty((n,) + shape)
+    inv_denominator[0] = 1 / b[0]
+    for i in range(1, n):
+        c_star[i-1] = c[i-1] * inv_denominator[i-1]
+        inv_denominator[i] = 1 / (b[i] - a[i-1] * c_star[i-1])
+    return ThomasFactor(np.broadcast_to(a, (n - 1,) + shape), c_star, inv_denominator)
+
+def _thomas_solve(factor, d, out, work):
+    # Forward sweep writes d* into out, back substitution then overwrites it with x.
+    # Rows are taken as out[i, ...] so they stay writable views even for a single system.
+    a, c_star, inv_denominator = factor.lower, factor.c_star, factor.inv_denominator
+    np.multiply(d[0, ...], inv_denominator[0, ...], out=out[0, ...])
+    for i in range(1, factor.n):
+        np.multiply(a[i-1, ...], out[i-1, ...], out=work)
+        np.subtract(d[i, ...], work, out=out[i, ...])
+        out[i, ...] *= inv_denominator[i, ...]
+    for i in range(factor.n - 2, -1, -1):
+        np.multiply(c_star[i, ...], out[i+1, ...], out=work)
+        out[i, ...] -= work
+    return out
+
+def thomas_factor(a, b, c):
+    """Factor tridiagonal system(s) given as (..., n-1), (..., n), (..., n-1) arrays."""
+    a, b, c = (np.moveaxis(np.asarray(v, dtype=float), -1, 0) for v in (a, b, c))
+    return _thomas_factor(a, b, c)
+
+def thomas_solve(factor, d, out=None, work=None):
+    """Solve with a ThomasFactor for right-hand side(s) d of shape (..., n).
+
+    out may be d itself (solved in place). Passing out and a work buffer of the batch
+    shape makes the solve allocation-free, e.g. inside a time-stepping loop.
+    """
+    d = np.asarray(d, dtype=float)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(d.shape, factor.batch_shape + (factor.n,)))
+    shape = out.shape[:-1]
+    if work is None:
+        work = np.empty(shape)
+    _thomas_solve(factor, np.moveaxis(d, -1, 0), np.moveaxis(out, -1, 0), work)
+    return out
+
+def batched_thomas(a, b, c, d, out=None, work=None):
+    """Solve many independent tridiagonal systems at once (Gauss-Thomas across the batch axis).
+
+    Coefficients use the gauss_thomas layout along the last axis: a and c hold n-1
+    entries, b and d hold n. Leading axes are batch axes and broadcast together.
+    """
+    return thomas_solve(thomas_factor(a, b, c), d, out, work)
+
+def partitioned_thomas(a, b, c, d, num_blocks=None, workers=None):
+    """SPIKE-style partitioned solver for one very large tridiagonal system.
+
+    The system is cut into num_blocks blocks. Every block is factored and solved for
+    its right-hand side plus the two coupling spikes; groups of blocks run on a thread
+    pool over shared arrays (NumPy releases the GIL inside each whole-group operation).
+    A small 2*num_blocks interface system then glues the blocks together.
+    Same a/b/c/d layout and results as gauss_thomas.
+    """
+    n = len(b)
+    workers = workers or os.cpu_count()
+    num_blocks = max(1, min(num_blocks or max(workers, int(np.sqrt(n))), n // 2))
+    m = -(-n // num_blocks)
+    padding = num_blocks * m - n
+
+    # Equation-major (m, num_blocks) layout: row i of every block is one contiguous vector;
+    # padded rows are identity equations
+    def blocks(values, fill):
+        return np.ascontiguousarray(np.concatenate((values, np.full(padding, fill))).reshape(num_blocks, m).T)
+    lower = blocks(np.concatenate(([0.0], a)), 0.0)
+    diagonal = blocks(np.asarray(b, dtype=float), 1.0)
+    upper = blocks(np.concatenate((c, [0.0])), 0.0)
+    rhs = np.zeros((m, 3, num_blocks))
+    rhs[:, 0] = blocks(np.asarray(d, dtype=float), 0.0)
+    rhs[m-1, 1] = upper[m-1]
+    rhs[0, 2] = lower[0]
+
+    # Columns: the block's own solution y, then the spikes v (from x_{k+1}[0]) and w (from x_{k-1}[-1])
+    spikes = np.empty_like(rhs)
+    def solve_group(group):
+        factor = _thomas_factor(lower[1:, group], diagonal[:, group], upper[:-1, group])
+        _thomas_solve(factor, rhs[:, :, group], spikes[:, :, group], np.empty((3, group.stop - group.start)))
+    edges = np.linspace(0, num_blocks, min(workers, num_blocks) + 1).astype(int)
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(solve_group, [slice(start, stop) for start, stop in zip(edges[:-1], edges[1:])]))
+
+    # Interface unknowns ordered (top_0, bottom_0, top_1, bottom_1, ...)
+    k = np.arange(num_blocks)
+    top, bottom = 2 * k, 2 * k + 1
+    rows = np.concatenate((top, bottom, top[:-1], bottom[:-1], top[1:], bottom[1:]))
+    cols = np.concatenate((top, bottom, top[1:], top[1:], bottom[:-1], bottom[:-1]))
+    values = np.concatenate((np.ones(2 * num_blocks), spikes[0, 1, :-1], spikes[m-1, 1, :-1],
+                             spikes[0, 2, 1:], spikes[m-1, 2, 1:]))
+    reduced = sps.csr_matrix((values, (rows, cols)), shape=(2 * num_blocks, 2 * num_blocks))
+    interface = spla.spsolve(reduced.tocsc(), np.column_stack((spikes[0, 0], spikes[m-1, 0])).ravel())
+
+    next_top = np.append(interface[top[1:]], 0.0)
+    previous_bottom = np.insert(interface[bottom[:-1]], 0, 0.0)
+    x = spikes[:, 0] - spikes[:, 1] * next_top - spikes[:, 2] * previous_bottom
+    return x.T.ravel()[:n]
+
+class TridiagonalMatrix:
+    """Tridiagonal matrix kept as three contiguous bands instead of a dense n x n array.
+
+    lower[i] = A[i+1, i], diag[i] = A[i, i], upper[i] = A[i, i+1] (the gauss_thomas a/b/c layout).
+    """
+    __slots__ = ("lower", "diag", "upper")
+
+    def __init__(self, lower, diag, upper):
+        self.lower = np.ascontiguousarray(lower, dtype=float)
+        self.diag = np.ascontiguousarray(diag, dtype=float)
+        self.upper = np.ascontiguousarray(upper, dtype=float)
+        if not len(self.lower) == len(self.upper) == len(self.diag) - 1:
+            raise ValueError("lower and upper bands must have exactly one entry fewer than diag")
+
+    @property
+    def n(self):
+        return len(self.diag)
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        """A[i:j] is the principal sub-matrix on rows/columns i..j-1; A[i, j] is one entry.
+
+        Negative indices count from the end as usual; anything outside [-n, n) raises IndexError.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.n)
+            if step != 1:
+                raise ValueError("only contiguous slices of a tridiagonal matrix are tridiagonal")
+            stop = max(stop, start)
+            return TridiagonalMatrix(self.lower[start:stop-1], self.diag[start:stop], self.upper[start:stop-1])
+        if not (isinstance(index, tuple) and len(index) == 2):
+            raise TypeError("index a tridiagonal matrix with a slice or an (i, j) pair")
+        i, j = (self._normalize_index(k) for k in index)
+        return self.diag[i] if i == j else self.lower[j] if i == j + 1 else self.upper[i] if j == i + 1 else 0.0
+
+    def _normalize_index(self, k):
+        k = operator.index(k)
+        if not -self.n <= k < self.n:
+            raise IndexError(f"index {k} is out of range for a {self.n}x{self.n} matrix")
+        return k + self.n if k < 0 else k
+
+    def matvec(self, x):
+        """A @ x along the last axis of x."""
+        x = np.asarray(x, dtype=float)
+        y = self.diag * x
+        y[..., 1:] += self.lower * x[..., :-1]
+        y[..., :-1] += self.upper * x[..., 1:]
+        return y
+
+    __matmul__ = matvec
+
+    def factor(self):
+        """Thomas factorization for repeated solves with thomas_solve."""
+        return thomas_factor(self.lower, self.diag, self.upper)
+
+    def solve(self, d, out=None):
+        d = np.asarray(d, dtype=float)
+        # One long system: the partitioned solver vectorizes across blocks instead of looping over n
+        if d.ndim == 1 and out is None and self.n >= PARTITIONED_MIN_SIZE:
+            return partitioned_thomas(self.lower, self.diag, self.upper, d)
+        return batched_thomas(self.lower, self.diag, self.upper, d, out)
+
+    def to_band(self):
+        return tridiagonal_to_band(self.lower, self.diag, self.upper)
+
+    def to_dense(self):
+        return np.diag(self.diag) + np.diag(self.lower, -1) + np.diag(self.upper, 1)
+
+    def to_table(self, rhs=None, max_size=8, tablefmt="fancy_grid", floatfmt="g"):
+        """Render the matrix (and optional right-hand side column) showing at most max_size rows/columns."""
+        shown = list(range(self.n)) if self.n <= max_size else \
+            list(range(max_size // 2)) + [None] + list(range(self.n - max_size // 2, self.n))
+        headers = [f"x{j+1}" if j is not None else "..." for j in shown] + (["d"] if rhs is not None else [])
+        table = []
+        for i in shown:
+            if i is None:
+                table.append(["..."] * len(headers))
+                continue
+            row = [self[i, j] if j is not None else "..." for j in shown]
+            table.append(row + ([rhs[i]] if rhs is not None else []))
+        return tabulate(table, headers=headers, tablefmt=tablefmt, floatfmt=floatfmt)
+
+    def __str__(self):
+        return self.to_table(tablefmt="plain")
+
+    def __repr__(self):
+        return f"TridiagonalMatrix(n={self.n})"
+
+def tridiagonal_to_band(a, b, c):
+    """Pack gauss_thomas-style diagonals into (3, n) band storage."""
+    return np.vstack((np.append(0.0, c), b, np.append(a, 0.0))).astype(float)
+
+def band_to_dense(ab, lower, upper, periodic=False):
+    """Expand band storage to a dense matrix (with k x k blocks if ab has shape (bands, n, k, k)).
+
+    Band storage follows scipy.linalg.solve_banded: ab[upper + i - j, j] = A[i, j]. For
+    periodic matrices the wrap-around entries sit in the otherwise unused band slots,
+    i.e. the same formula with i and j taken modulo n.
+    """
+    n = ab.shape[1]
+    k = ab.shape[2] if ab.ndim == 4 else 1
+    dense = np.zeros((n, k, n, k))
+    for row in range(lower + upper + 1):
+        for j in range(n):
+            i = j + row - upper
+            if 0 <= i < n or periodic:
+                dense[i % n, :, j, :] += ab[row, j].reshape(k, k)
+    return dense.reshape(n * k, n * k)
+
+def solve_cyclic_tridiagonal(ab, d):
+    """Solve a periodic tridiagonal system in O(n) with the Sherman-Morrison correction.
+
+    ab is (3, n) band storage with the corners A[n-1, 0] in ab[0, 0] and A[0, n-1] in
+    ab[2, n-1]; d has shape (..., n).
+    """
+    n = ab.shape[1]
+    alpha, beta = ab[0, 0], ab[2, n-1]
+    gamma = -ab[1, 0]
+    diagonal = ab[1].copy()
+    diagonal[0] -= gamma
+    diagonal[n-1] -= alpha * beta / gamma
+    factor = thomas_factor(ab[2, :-1], diagonal, ab[0, 1:])
+
+    u = np.zeros(n)
+    u[0], u[n-1] = gamma, alpha
+    x = thomas_solve(factor, d)
+    z = thomas_solve(factor, u)
+    correction = (x[..., 0] + beta * x[..., n-1] / gamma) / (1 + z[0] + beta * z[n-1] / gamma)
+    return x - correction[..., None] * z
+
+def solve_block_tridiagonal(ab, d):
+    """Block Thomas algorithm for (3, n, k, k) band storage; d has shape (n, k) or (n, k, m)."""
+    n = ab.shape[1]
+    d = np.asarray(d, dtype=float)
+    c_star = np.empty((n - 1,) + ab.shape[2:])
+    d_star = np.empty(d.shape)
+    if n > 1:
+        c_star[0] = np.linalg.solve(ab[1, 0], ab[0, 1])
+    d_star[0] = np.linalg.solve(ab[1, 0], d[0])
+    for i in range(1, n):
+        pivot = ab[1, i] - ab[2, i-1] @ c_star[i-1]
+        if i < n - 1:
+            c_star[i] = np.linalg.solve(pivot, ab[0, i+1])
+        d_star[i] = np.linalg.solve(pivot, d[i] - ab[2, i-1] @ d_star[i-1])
+    x = d_star
+    for i in range(n - 2, -1, -1):
+        x[i] -= c_star[i] @ x[i+1]
+    return x
+
+def solve_pentadiagonal(ab, d):
+    """Solve a pentadiagonal system from (5, n) band storage without pivoting (PTRANS-I); d is (..., n)."""
+    n = ab.shape[1]
+    # Padded diagonals indexed by row i + 2: second/first lower, main, first/second upper
+    e, c, main, a, b = (np.zeros(n + 2) for _ in range(5))
+    e[4:], c[3:n+2], main[2:] = ab[4, :n-2], ab[3, :n-1], ab[2]
+    a[2:n+1], b[2:n] = ab[1, 1:], ab[0, 2:]
+
+    d = np.moveaxis(np.asarray(d, dtype=float), -1, 0)
+    alpha, beta = np.zeros(n + 2), np.zeros(n + 2)
+    z = np.zeros((n + 2,) + d.shape[1:])
+    for i in range(2, n + 2):
+        gamma = c[i] - alpha[i-2] * e[i]
+        mu = main[i] - beta[i-2] * e[i] - alpha[i-1] * gamma
+        alpha[i] = (a[i] - beta[i-1] * gamma) / mu
+        beta[i] = b[i] / mu
+        z[i] = (d[i-2] - z[i-2] * e[i] - z[i-1] * gamma) / mu
+
+    x = np.zeros((n + 4,) + d.shape[1:])
+    for i in range(n + 1, 1, -1):
+        x[i] = z[i] - alpha[i] * x[i+1] - beta[i] * x[i+2]
+    return np.moveaxis(x[2:n+2], 0, -1)
+
+def benchmark_banded(n=2000, k=3, repeat=3):
+    """Check every banded solver against the dense np.linalg.solve path and compare timings."""
+    rng = np.random.default_rng(0)
+    def timed(solve):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            x = solve()
+            timings.append(time.perf_counter() - start)
+        return x, min(timings)
+
+    cases = []
+    tri = rng.uniform(-1, 1, (3, n))
+    tri[1] = 4 + rng.uniform(0, 1, n)
+    cases.append(("Tridiagonal (Thomas)", tri, 1, 1, False, rng.uniform(0, 1, n),
+                  lambda ab, d: batched_thomas(ab[2, :-1], ab[1], ab[0, 1:], d)))
+    cases.append(("Cyclic tridiagonal", tri, 1, 1, True, rng.uniform(0, 1, n), solve_cyclic_tridiagonal))
+    penta = rng.uniform(-1, 1, (5, n))
+    penta[2] = 6 + rng.uniform(0, 1, n)
+    penta[0, :2] = penta[1, 0] = penta[3, -1] = penta[4, -2:] = 0
+    cases.append(("Pentadiagonal", penta, 2, 2, False, rng.uniform(0, 1, n), solve_pentadiagonal))
+    blocks = rng.uniform(-1, 1, (3, n, k, k))
+    blocks[1] += (2 * k + 2) * np.eye(k)
+    blocks[0, 0] = blocks[2, -1] = 0
+    cases.append((f"Block tridiagonal ({k}x{k})", blocks, 1, 1, False, rng.uniform(0, 1, (n, k)),
+                  solve_block_tridiagonal))
+
+    rows = []
+    for name, ab, lower, upper, periodic, d, solver in cases:
+        dense = band_to_dense(ab, lower, upper, periodic)
+        x_dense, dense_time = timed(lambda: np.linalg.solve(dense, d.ravel()))
+        x_band, band_time = timed(lambda: solver(ab, d))
+        rows.append([name, f"{np.abs(np.ravel(x_band) - x_dense).max():.2e}",
+                     f"{band_time * 1e3:.2f} ms", f"{dense_time * 1e3:.2f} ms", f"{dense_time / band_time:.1f}x"])
+    print(tabulate(rows, headers=["Solver", "Max error vs dense", "Banded", "Dense", "Speedup"],
+                   tablefmt="fancy_grid"))
+    return rows
+
+def benchmark_partitioned(n=10**7, core_counts=None, repeat=3):
+    """Time partitioned_thomas against core count.
+
+    Accuracy is checked against LAPACK's banded solver, since a Python-level sequential
+    sweep over 10^7 unknowns would dominate the benchmark.
+    """
+    rng = np.random.default_rng(0)
+    a, c = rng.uniform(1, 2, n - 1), rng.uniform(1, 2, n - 1)
+    b, d = rng.uniform(5, 6, n), rng.uniform(0, 1, n)
+    core_counts = core_counts or sorted({1, 2, 4, 8, os.cpu_count()} & set(range(1, os.cpu_count() + 1)))
+
+    reference = solve_banded((1, 1), np.vstack((np.append(0.0, c), b, np.append(a, 0.0))), d)
+    rows, baseline = [], None
+    for cores in core_counts:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            x = partitioned_thomas(a, b, c, d, workers=cores)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        baseline = baseline or best
+        rows.append([cores, f"{best:.3f} s", f"{baseline / best:.2f}x", f"{np.abs(x - reference).max():.2e}"])
+    print(tabulate(rows, headers=["Cores", "Time", "Speedup", "Max error"], tablefmt="fancy_grid"))
+    return rows
+
+if __name__ == "__main__":
+    benchmark_banded()
+    benchmark_partitioned()
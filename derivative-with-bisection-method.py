@@ -1,16 +1,19 @@
-import sympy as sp
+from expression_cache import compile_expression
+from root_finding import find_brackets
 
 def bisection_method(func, a, b, tolerance=1e-7, max_iter=100):
-    if func(a) * func(b) >= 0:
+    func_a = func(a)
+    if func_a * func(b) >= 0:
         print("The bisection method cannot be applied because the signs of func(a) and func(b) are not opposite.")
         return None, 0, 0
 
     iteration = 0
     while (b - a) / 2 > tolerance and iteration < max_iter:
         c = (a + b) / 2
-        if func(c) == 0:
+        func_c = func(c)
+        if func_c == 0:
             return c, iteration, (b - a) / 2
-        (b, a) = (c, a) if func(c) * func(a) < 0 else (b, c)
+        (b, a, func_a) = (c, a, func_a) if func_c * func_a < 0 else (b, c, func_c)
         iteration += 1
 
     return (a + b) / 2, iteration, (b - a) / 2
@@ -19,16 +22,12 @@ def central_difference_derivative(func, x, h=1e-5):
     return (func(x + h) - func(x - h)) / (2 * h)
 
 def parse_function(expression):
-    x = sp.symbols('x')
-    expr = sp.sympify(expression)
-    return sp.lambdify(x, expr, "numpy")
+    return compile_expression(expression).func
 
 def find_interval_for_bisection(func, x_start=-10, x_end=10, step_size=0.1):
-    a, b = x_start, x_start + step_size
-    while b <= x_end:
-        if func(a) * func(b) < 0:
-            return a, b
-        a, b = a + step_size, b + step_size
+    a, b, _ = find_brackets(func, x_start, x_end, step_size=step_size)
+    if a.size:
+        return float(a[0]), float(b[0])
 
     print("No sign change found within the specified range.")
     return None, None
@@ -56,4 +55,4 @@ def main():
         print("Couldn't find a suitable interval for the Bisection Method.")
 
 if __name__ == "__main__":
-main()
+    main()
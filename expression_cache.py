@@ -0,0 +1,144 @@
+from collections import OrderedDict
+import numpy as np
+import sympy as sp
+
+class CompiledExpression:
+    """Sympified expression(s) plus lazily built numeric variants, shared through the cache."""
+    __slots__ = ("expr", "symbols", "func", "_derivatives", "_jacobian", "_sparse_jacobian", "_vectorized",
+                 "_newton_kernel")
+
+    def __init__(self, expr, symbols):
+        self.expr = expr
+        self.symbols = symbols
+        args = symbols[0] if len(symbols) == 1 else symbols
+        self.func = sp.lambdify(args, expr, "numpy")
+        self._derivatives = {}
+        self._jacobian = None
+        self._sparse_jacobian = None
+        self._vectorized = None
+        self._newton_kernel = None
+
+    def derivative(self, order=1, var=None):
+        """Compiled d^order/dvar^order of a scalar expression (var defaults to the first symbol)."""
+        var = self.symbols[0] if var is None else sp.Symbol(str(var))
+        key = (order, var)
+        if key not in self._derivatives:
+            args = self.symbols[0] if len(self.symbols) == 1 else self.symbols
+            self._derivatives[key] = sp.lambdify(args, sp.diff(self.expr, var, order), "numpy")
+        return self._derivatives[key]
+
+    @property
+    def jacobian(self):
+        """Compiled Jacobian (nested list) of the expression or system w.r.t. all symbols."""
+        if self._jacobian is None:
+            exprs = self.expr if isinstance(self.expr, list) else [self.expr]
+            matrix = [[sp.diff(eq, var) for var in self.symbols] for eq in exprs]
+            self._jacobian = sp.lambdify(self.symbols, matrix, "numpy")
+        return self._jacobian
+
+    @property
+    def sparse_jacobian(self):
+        """Compiled nonzero Jacobian entries of a system plus their fixed CSR structure.
+
+        Returns (values, indices, indptr) where values([x1, ..., xn]) lists the structurally
+        nonzero entries row by row; only those entries are differentiated and evaluated.
+        """
+        if self._sparse_jacobian is None:
+            exprs = self.expr if isinstance(self.expr, list) else [self.expr]
+            position = {var: j for j, var in enumerate(self.symbols)}
+            entries = []
+            for i, expr in enumerate(exprs):
+                for var in sorted(expr.free_symbols & position.keys(), key=position.get):
+                    derivative = sp.diff(expr, var)
+                    if derivative != 0:
+                        entries.append((i, position[var], derivative))
+            rows = np.array([i for i, _, _ in entries], dtype=np.int64)
+            indices = np.array([j for _, j, _ in entries], dtype=np.int64)
+            indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(exprs)))))
+            values = sp.lambdify([list(self.symbols)], [d for _, _, d in entries], "numpy", cse=True)
+            self._sparse_jacobian = (values, indices, indptr)
+        return self._sparse_jacobian
+
+    @property
+    def vectorized(self):
+        """Like func, but always returns a float array broadcast to the input shape."""
+        if self._vectorized is None:
+            func = self.func
+            def vectorized(*args):
+                args = np.broadcast_arrays(*[np.asarray(arg, dtype=float) for arg in args])
+                return np.broadcast_to(np.asarray(func(*args), dtype=float), args[0].shape)
+            self._vectorized = vectorized
+        return self._vectorized
+
+    @property
+    def newton_kernel(self):
+        """Compiled kernel returning (f, df/dx) together, sharing common subexpressions via cse.
+
+        Derivative is taken w.r.t. the first symbol; any further symbols are per-element parameters.
+        """
+        if self._newton_kernel is None:
+            exprs = [self.expr, sp.diff(self.expr, self.symbols[0])]
+            fused = sp.lambdify(self.symbols, exprs, "numpy", cse=True)
+            def newton_kernel(x, *params):
+                x = np.asarray(x, dtype=float)
+                func_value, derivative_value = fused(x, *params)
+                return (np.broadcast_to(np.asarray(func_value, dtype=float), x.shape),
+                        np.broadcast_to(np.asarray(derivative_value, dtype=float), x.shape))
+            self._newton_kernel = newton_kernel
+        return self._newton_kernel
+
+class ExpressionCache:
+    """Bounded LRU cache of CompiledExpression keyed on the normalized expression and variables."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def normalize(expression, variables):
+        if isinstance(expression, str):
+            normalized = "".join(expression.split())
+        else:
+            normalized = tuple("".join(str(eq).split()) for eq in expression)
+        return normalized, tuple(str(v) for v in variables)
+
+    def get(self, expression, variables=("x",)):
+        key = self.normalize(expression, variables)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        symbols = tuple(sp.Symbol(name) for name in key[1])
+        if isinstance(key[0], str):
+            expr = sp.sympify(key[0])
+        else:
+            expr = [sp.sympify(eq) for eq in key[0]]
+        entry = CompiledExpression(expr, symbols)
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+_default_cache = ExpressionCache()
+
+def compile_expression(expression, variables=("x",)):
+    """Return the cached CompiledExpression for a string (or list of strings for a system)."""
+    return _default_cache.get(expression, variables)
+
+def cache_stats():
+    return _default_cache.stats()
+
+def clear_cache():
+    _default_cache.clear()
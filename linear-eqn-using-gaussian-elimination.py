@@ -1,4 +1,6 @@
 import numpy as np
+from tracing import IterationTrace
+from lu_factorization import lu_factor, lu_factor_inplace
 
 def print_matrix(matrix, step=""):
     """Helper function to print the matrix in a more readable format."""
@@ -7,45 +9,41 @@ def print_matrix(matrix, step=""):
         print("  ".join(f"{elem:8.2f}" for elem in row))
     print("\n" + "-"*50)
 
-def gaussian_elimination(A, B):
-    n = len(B)
-    augmented_matrix = np.hstack((A, B.reshape(-1, 1)))
-    
-    # Initial augmented matrix
-    print_matrix(augmented_matrix, "Initial Augmented Matrix:")
-    
-    for i in range(n):
-        # Pivoting (row swapping)
-        max_row = np.argmax(np.abs(augmented_matrix[i:n, i])) + i
-        augmented_matrix[[i, max_row]] = augmented_matrix[[max_row, i]]
-        
-        print_matrix(augmented_matrix, f"After swapping row {i+1} with row {max_row+1}:")
-        
-        # Normalize the pivot row
-        augmented_matrix[i] = augmented_matrix[i] / augmented_matrix[i, i]
-        
-        print_matrix(augmented_matrix, f"After normalizing row {i+1}:")
-        
-        # Eliminate the entries below the pivot
-        for j in range(i + 1, n):
-            augmented_matrix[j] -= augmented_matrix[i] * augmented_matrix[j, i]
-        
-        print_matrix(augmented_matrix, f"After eliminating column {i+1}:")
-    
-    # Back substitution to solve for the variables
-    solution = np.zeros(n)
-    for i in range(n-1, -1, -1):
-        solution[i] = augmented_matrix[i, -1] - np.dot(augmented_matrix[i, i+1:n], solution[i+1:]) if i < n-1 else augmented_matrix[i, -1]
-    
-    return solution
+def gaussian_elimination(A, B, trace=None):
+    # Elimination with partial pivoting via the blocked LU engine. With a trace, the whole
+    # matrix is factored as one panel so every pivot column records a full elimination step:
+    # U on and above the diagonal, the row multipliers of L below it, and the permuted,
+    # forward-eliminated right-hand side as the augmented column.
+    A = np.array(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if trace is None:
+        return lu_factor(A).solve(B)
+    trace("Initial Augmented Matrix:", np.column_stack((A, B)))
 
-A = np.array([[2, 1, 1], [3, 2, 3], [1, 4, 9]], dtype=float)
-B = np.array([10, 18, 16], dtype=float)
+    pivots_done = 0
+    def record(step, snapshot, perm):
+        # Apply the finished columns of L to the permuted right-hand side
+        nonlocal pivots_done
+        pivots_done += 1
+        rhs = B[perm]
+        for k in range(pivots_done):
+            rhs[k+1:] -= snapshot[k+1:, k] * rhs[k]
+        trace(step, np.column_stack((snapshot, rhs)))
+    return lu_factor_inplace(A, block_size=max(len(A), 1), trace=record).solve(B)
 
-solution = gaussian_elimination(A, B)
+if __name__ == "__main__":
+    A = np.array([[2, 1, 1], [3, 2, 3], [1, 4, 9]], dtype=float)
+    B = np.array([10, 18, 16], dtype=float)
 
-# Final Solution Output
-print("\nFinal Solution:")
-print(f"x = {solution[0]:.3f}")
-print(f"y = {solution[1]:.3f}")
-print(f"z = {solution[2]:.3f}")
\ No newline at end of file
+    show_steps = input("Show the elimination steps? (y/N): ").strip().lower() in ('y', 'yes')
+    trace = IterationTrace() if show_steps else None
+    solution = gaussian_elimination(A, B, trace=trace)
+    if trace is not None:
+        for step, matrix in trace.records():
+            print_matrix(matrix, step)
+
+    # Final Solution Output
+    print("\nFinal Solution:")
+    print(f"x = {solution[0]:.3f}")
+    print(f"y = {solution[1]:.3f}")
+    print(f"z = {solution[2]:.3f}")
@@ -0,0 +1,64 @@
+import numpy as np
+from scipy.linalg import solve_triangular
+
+class LUFactor:
+    """PA = LU with unit-lower L and upper U packed in one array, reusable for many right-hand sides."""
+    __slots__ = ("lu", "perm")
+
+    def __init__(self, lu, perm):
+        self.lu = lu
+        self.perm = perm
+
+    def solve(self, b):
+        """Solve A x = b for a vector or for every column of a (n, m) right-hand side."""
+        y = np.asarray(b, dtype=float)[self.perm]
+        y = solve_triangular(self.lu, y, lower=True, unit_diagonal=True, check_finite=False)
+        return solve_triangular(self.lu, y, lower=False, check_finite=False)
+
+    def det(self):
+        # Each transposition in perm flips the sign
+        n = len(self.perm)
+        visited, swaps = np.zeros(n, dtype=bool), 0
+        for start in range(n):
+            length = 0
+            while not visited[start]:
+                visited[start], start, length = True, self.perm[start], length + 1
+            swaps += max(length - 1, 0)
+        return (-1) ** swaps * np.prod(np.diagonal(self.lu))
+
+def lu_factor_inplace(A, block_size=64, trace=None):
+    """Blocked right-looking LU factorization with partial pivoting, overwriting A.
+
+    Each panel of block_size columns is factored with rank-1 updates, then the trailing
+    matrix gets one triangular solve and one matrix-matrix update. A must be a square,
+    writable float array. Raises np.linalg.LinAlgError for a singular matrix.
+    trace(step, snapshot, perm) is called after every pivot column when given, with copies
+    of the partially factored matrix and the row permutation so far.
+    """
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("LU factorization needs a square matrix.")
+    n = A.shape[0]
+    perm = np.arange(n)
+    for k in range(0, n, block_size):
+        end = min(k + block_size, n)
+        for j in range(k, end):
+            pivot = j + np.argmax(np.abs(A[j:, j]))
+            if A[pivot, j] == 0:
+                raise np.linalg.LinAlgError("Matrix is singular.")
+            if pivot != j:
+                A[[j, pivot]] = A[[pivot, j]]
+                perm[[j, pivot]] = perm[[pivot, j]]
+            A[j+1:, j] /= A[j, j]
+            A[j+1:, j+1:end] -= np.outer(A[j+1:, j], A[j, j+1:end])
+            if trace is not None:
+                swap = f"row {pivot+1} swapped in" if pivot != j else "no swap"
+                trace(f"Pivot column {j+1} ({swap}):", A.copy(), perm.copy())
+        if end < n:
+            A[k:end, end:] = solve_triangular(A[k:end, k:end], A[k:end, end:], lower=True,
+                                              unit_diagonal=True, check_finite=False)
+            A[end:, end:] -= A[end:, k:end] @ A[k:end, end:]
+    return LUFactor(A, perm)
+
+def lu_factor(A, block_size=64):
+    """Like lu_factor_inplace, but works on a float copy and leaves A untouched."""
+    return lu_factor_inplace(np.array(A, dtype=float), block_size)
@@ -0,0 +1,240 @@
+import contextlib
+import io
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import sympy as sp
+import scipy.sparse as sps
+import scipy.sparse.linalg as spla
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from expression_cache import compile_expression
+
+def parse_sparse_system(equations, vars):
+    """Compile a system into a vectorized residual and a CSR Jacobian builder.
+
+    Goes through the shared expression cache, so repeated solves of the same system skip
+    sympify and differentiation. The Jacobian's sparsity pattern comes from each
+    equation's free symbols, so only structurally nonzero entries are evaluated.
+    Returns (residual, jacobian) where residual(x) -> array and jacobian(x) -> csr_matrix.
+    """
+    compiled = compile_expression(equations, vars)
+    values_list, indices, indptr = compiled.sparse_jacobian
+    residual_list = compiled.func
+    shape = (len(equations), len(vars))
+
+    def residual(x):
+        return np.array(residual_list(*x), dtype=float)
+
+    def jacobian(x):
+        data = np.array(values_list(x), dtype=float)
+        return sps.csr_matrix((data, indices, indptr), shape=shape)
+
+    return residual, jacobian
+
+def solve_sparse_step(J_matrix, rhs, linear_solver="direct", tolerance=1e-10):
+    """Solve J delta = rhs with a sparse direct (SuperLU) or ILU-preconditioned Krylov solver."""
+    if linear_solver == "direct":
+        return spla.spsolve(J_matrix.tocsc(), rhs)
+    ilu = spla.spilu(J_matrix.tocsc())
+    preconditioner = spla.LinearOperator(J_matrix.shape, ilu.solve)
+    krylov = {"gmres": spla.gmres, "bicgstab": spla.bicgstab}[linear_solver]
+    delta, info = krylov(J_matrix, rhs, M=preconditioner, rtol=tolerance)
+    if info != 0:
+        raise np.linalg.LinAlgError(f"{linear_solver} did not converge (info={info})")
+    return delta
+
+def newton_raphson_method_sparse(residual, jacobian, x0, tolerance=1e-7, max_iter=100, linear_solver="direct"):
+    """Newton-Raphson for large sparse systems built by parse_sparse_system."""
+    iteration = 0
+    x0 = np.array(x0, dtype=float)
+    while iteration < max_iter:
+        F_values = residual(x0)
+        try:
+            delta = solve_sparse_step(jacobian(x0), -F_values, linear_solver)
+        except (RuntimeError, np.linalg.LinAlgError) as e:
+            print(f"Error: sparse linear solve failed ({e}). The method failed.")
+            return None, iteration
+        if not np.all(np.isfinite(delta)):
+            print("Error: Jacobian matrix is singular. The method failed.")
+            return None, iteration
+        x1 = x0 + delta
+        if np.linalg.norm(F_values) < tolerance:
+            return x1, iteration
+        x0 = x1
+        iteration += 1
+    print("Maximum iterations reached.")
+    return x1, iteration
+
+def parse_dense_system(equations, vars):
+    """Vector residual(x) and dense jacobian(x) for small systems, via the shared expression cache."""
+    compiled = compile_expression(equations, vars)
+    def residual(x):
+        return np.array(compiled.func(*x), dtype=float)
+    def jacobian(x):
+        return np.array(compiled.jacobian(*x), dtype=float)
+    return residual, jacobian
+
+def modified_newton_method(residual, jacobian, x0, tolerance=1e-7, max_iter=100, max_reuse=5, slow_ratio=0.5):
+    """Newton iteration that keeps one LU factorization for up to max_reuse steps.
+
+    The Jacobian is re-evaluated and refactorized early whenever the residual norm
+    shrinks by less than slow_ratio in a step. max_reuse=1 is plain Newton-Raphson.
+    Returns (x, iterations, counters).
+    """
+    counters = {"residual_evaluations": 0, "jacobian_evaluations": 0, "factorizations": 0}
+    x = np.array(x0, dtype=float)
+    F_values = residual(x)
+    counters["residual_evaluations"] += 1
+    lu_piv, age = None, 0
+    for iteration in range(max_iter):
+        if np.linalg.norm(F_values) < tolerance:
+            return x, iteration, counters
+        if lu_piv is None or age >= max_reuse:
+            J_matrix = jacobian(x)
+            counters["jacobian_evaluations"] += 1
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", LinAlgWarning)
+                try:
+                    lu_piv = lu_factor(J_matrix)
+                except (LinAlgWarning, ValueError):
+                    print("Error: Jacobian matrix is singular. The method failed.")
+                    return None, iteration, counters
+            counters["factorizations"] += 1
+            age = 0
+        x = x + lu_solve(lu_piv, -F_values)
+        F_new = residual(x)
+        counters["residual_evaluations"] += 1
+        age += 1
+        # Convergence has slowed down: refresh the Jacobian on the next step
+        if np.linalg.norm(F_new) > slow_ratio * np.linalg.norm(F_values):
+            age = max_reuse
+        F_values = F_new
+    print("Maximum iterations reached.")
+    return x, max_iter, counters
+
+def broyden_method(residual, jacobian, x0, tolerance=1e-7, max_iter=100, update="good"):
+    """Broyden's quasi-Newton method with the "good" or "bad" inverse-Jacobian update.
+
+    The Jacobian is evaluated and inverted once at x0; later steps only apply rank-one
+    updates. Returns (x, iterations, counters).
+    """
+    counters = {"residual_evaluations": 1, "jacobian_evaluations": 1, "factorizations": 1}
+    x = np.array(x0, dtype=float)
+    F_values = residual(x)
+    try:
+        H = np.linalg.inv(jacobian(x))
+    except np.linalg.LinAlgError:
+        print("Error: Jacobian matrix is singular. The method failed.")
+        return None, 0, counters
+    for iteration in range(max_iter):
+        if np.linalg.norm(F_values) < tolerance:
+            return x, iteration, counters
+        dx = -H @ F_values
+        x = x + dx
+        F_new = residual(x)
+        counters["residual_evaluations"] += 1
+        dF, F_values = F_new - F_values, F_new
+        H_dF = H @ dF
+        if update == "good":
+            denominator = dx @ H_dF
+            correction = np.outer(dx - H_dF, dx @ H)
+        else:
+            denominator = dF @ dF
+            correction = np.outer(dx - H_dF, dF)
+        if denominator == 0 or not np.isfinite(denominator):
+            print("Error: Broyden update broke down. The method failed.")
+            return None, iteration, counters
+        H += correction / denominator
+    print("Maximum iterations reached.")
+    return x, max_iter, counters
+
+def compare_system_methods(residual, jacobian, x0, tolerance=1e-7, max_iter=100):
+    """Run every dense mode from the same start; rows of (method, iterations, counters..., time)."""
+    methods = {
+        "Newton-Raphson": lambda: modified_newton_method(residual, jacobian, x0, tolerance, max_iter, max_reuse=1),
+        "Modified Newton": lambda: modified_newton_method(residual, jacobian, x0, tolerance, max_iter),
+        "Broyden (good)": lambda: broyden_method(residual, jacobian, x0, tolerance, max_iter, "good"),
+        "Broyden (bad)": lambda: broyden_method(residual, jacobian, x0, tolerance, max_iter, "bad"),
+    }
+    # Compile the lazily lambdified functions before anything is timed
+    residual(np.asarray(x0, dtype=float)), jacobian(np.asarray(x0, dtype=float))
+    rows = []
+    for name, run in methods.items():
+        start = time.perf_counter()
+        solution, iterations, counters = run()
+        elapsed = time.perf_counter() - start
+        converged = solution is not None and np.linalg.norm(residual(solution)) < tolerance
+        rows.append([name, iterations if converged else "failed", counters["residual_evaluations"],
+                     counters["jacobian_evaluations"], counters["factorizations"], f"{elapsed * 1e3:.3f} ms"])
+    return rows
+
+def polish_root(residual, jacobian, x, max_steps=10):
+    """Refine a converged root with extra Newton steps until they stop shrinking.
+
+    Roots accepted at a loose residual tolerance can sit far apart; after polishing they
+    agree to about cond(J) * machine epsilon. Returns (x, error_bound), where the bound is
+    the size of the last Newton step (max-norm).
+    """
+    error_bound = np.inf
+    for _ in range(max_steps):
+        try:
+            delta = np.linalg.solve(jacobian(x), -residual(x))
+        except np.linalg.LinAlgError:
+            break
+        step = np.max(np.abs(delta))
+        if not np.isfinite(step) or step >= error_bound:
+            break
+        x, error_bound = x + delta, step
+        if step <= 4 * np.finfo(float).eps * max(1.0, np.max(np.abs(x))):
+            break
+    return x, error_bound
+
+_worker_system = None
+
+def _init_multi_start_worker(equations, var_names):
+    # Each worker process compiles the system once and reuses it for every start
+    global _worker_system
+    _worker_system = parse_dense_system(equations, sp.symbols(var_names))
+
+def _solve_starts(starts, tolerance, max_iter):
+    residual, jacobian = _worker_system
+    solutions = []
+    # Divergent starts are expected: silence their messages and floating-point warnings
+    with contextlib.redirect_stdout(io.StringIO()), np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for x0 in starts:
+            solution, _, _ = modified_newton_method(residual, jacobian, x0, tolerance, max_iter, max_reuse=1)
+            if solution is not None and np.all(np.isfinite(solution)) and np.linalg.norm(residual(solution)) < tolerance:
+                solutions.append(polish_root(residual, jacobian, solution))
+    return solutions
+
+def multi_start_solve(equations, vars, num_starts=64, low=-10, high=10, tolerance=1e-7, max_iter=100,
+                      max_roots=None, distinct_tol=1e-6, max_workers=None, chunk_size=8, seed=None):
+    """Run Newton-Raphson from many random starts across a process pool.
+
+    tolerance only bounds the residual, so every converged root is first polished to
+    near machine precision (polish_root). Two roots are merged when their max-norm
+    distance is within distinct_tol plus both polishing error bounds, which covers
+    ill-conditioned and multiple roots where polishing stalls early. Once max_roots
+    distinct roots are known the remaining starts are cancelled. Returns a list of arrays.
+    """
+    var_names = [str(var) for var in vars]
+    starts = np.random.default_rng(seed).uniform(low, high, (num_starts, len(var_names)))
+    roots = []
+    pool = ProcessPoolExecutor(max_workers, initializer=_init_multi_start_worker,
+                               initargs=(list(equations), var_names))
+    try:
+        futures = [pool.submit(_solve_starts, starts[i:i + chunk_size], tolerance, max_iter)
+                   for i in range(0, num_starts, chunk_size)]
+        for future in as_completed(futures):
+            for solution, error_bound in future.result():
+                if all(np.max(np.abs(solution - root)) > distinct_tol + error_bound + bound for root, bound in roots):
+                    roots.append((solution, error_bound))
+            if max_roots is not None and len(roots) >= max_roots:
+                break
+    finally:
+        # Drops every start that has not begun yet once enough roots are known
+        pool.shutdown(wait=False, cancel_futures=True)
+    roots = [root for root, _ in roots]
+    return roots[:max_roots] if max_roots is not None else roots
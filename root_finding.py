@@ -0,0 +1,192 @@
+import numpy as np
+
+def batch_bisection(func, a, b, tolerance=1e-7, max_iter=100, params=()):
+    """Solve many bisection brackets at once with masked NumPy updates.
+
+    `a`, `b` and every array in `params` are broadcast together; `func` is called
+    as func(x, *params) on the still-active rows only, once per iteration.
+    Returns (roots, iterations, error_bounds); invalid brackets give a NaN root.
+    """
+    arrays = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                 *[np.asarray(p) for p in params])
+    a, b = arrays[0].ravel().copy(), arrays[1].ravel().copy()
+    params = [p.ravel() for p in arrays[2:]]
+    shape = arrays[0].shape
+
+    # Endpoint values are computed once and then only updated where a moves
+    func_a = np.asarray(func(a, *params), dtype=float) * np.ones_like(a)
+    func_b = np.asarray(func(b, *params), dtype=float) * np.ones_like(b)
+    valid = func_a * func_b < 0
+    roots = np.full(a.shape, np.nan)
+    iterations = np.zeros(a.shape, dtype=int)
+    error_bounds = np.zeros(a.shape)
+
+    active = np.flatnonzero(valid & ((b - a) / 2 > tolerance))
+    done = np.flatnonzero(valid & ~((b - a) / 2 > tolerance))
+    roots[done], error_bounds[done] = (a[done] + b[done]) / 2, (b[done] - a[done]) / 2
+
+    for iteration in range(max_iter):
+        if active.size == 0:
+            break
+        c = (a[active] + b[active]) / 2
+        func_c = np.asarray(func(c, *[p[active] for p in params]), dtype=float) * np.ones_like(c)
+
+        # Exact zeros finish immediately, like the scalar bisection_method
+        hit = func_c == 0
+        exact = active[hit]
+        roots[exact], iterations[exact] = c[hit], iteration
+        error_bounds[exact] = (b[exact] - a[exact]) / 2
+
+        left = func_c * func_a[active] < 0
+        b[active[left]] = c[left]
+        moved = ~left & ~hit
+        a[active[moved]], func_a[active[moved]] = c[moved], func_c[moved]
+
+        active = active[~hit]
+        iterations[active] = iteration + 1
+        converged = (b[active] - a[active]) / 2 <= tolerance
+        finished = active[converged]
+        roots[finished] = (a[finished] + b[finished]) / 2
+        error_bounds[finished] = (b[finished] - a[finished]) / 2
+        active = active[~converged]
+
+    # Rows that ran out of iterations still report their current midpoint
+    roots[active] = (a[active] + b[active]) / 2
+    error_bounds[active] = (b[active] - a[active]) / 2
+    return roots.reshape(shape), iterations.reshape(shape), error_bounds.reshape(shape)
+
+def _evaluate(func, x):
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(func(x), dtype=float), x.shape)
+
+def find_brackets(func, x_start=-10, x_end=10, num_points=2001, max_levels=3, refine_factor=8,
+                  zero_tol=1e-8, reject_poles=True, step_size=None):
+    """Find every sign-change bracket of func on [x_start, x_end] with whole-grid evaluations.
+
+    The grid is refined (at most max_levels times) inside intervals where the function
+    changes by more than its own size, which is where touching roots or close root pairs
+    hide. Returns (a, b, touching): bracket endpoint arrays ready for batch_bisection, and
+    grid points (exact or touching roots) where |f| has a local minimum below zero_tol.
+    step_size, when given, sets num_points from the grid spacing instead.
+    """
+    if step_size is not None:
+        num_points = int(round((x_end - x_start) / step_size)) + 1
+    x = np.linspace(x_start, x_end, int(num_points))
+    f = _evaluate(func, x)
+    with np.errstate(invalid="ignore"):
+        for level in range(max_levels):
+            magnitude = np.abs(f)
+            suspect = (f[:-1] * f[1:] >= 0) & (np.abs(np.diff(f)) > np.minimum(magnitude[:-1], magnitude[1:]))
+            index = np.flatnonzero(suspect)
+            if index.size == 0:
+                break
+            fractions = np.arange(1, refine_factor) / refine_factor
+            x_new = (x[index, None] + (x[index + 1] - x[index])[:, None] * fractions).ravel()
+            order = np.argsort(np.concatenate((x, x_new)), kind="stable")
+            x, f = np.concatenate((x, x_new))[order], np.concatenate((f, _evaluate(func, x_new)))[order]
+
+        finite = np.isfinite(f)
+        change = np.flatnonzero((f[:-1] * f[1:] < 0) & finite[:-1] & finite[1:])
+        if reject_poles and change.size:
+            # Shrinking onto a root makes |f| small; shrinking onto a pole makes it blow up
+            width = (x_end - x_start) / (num_points - 1)
+            inner, _, _ = batch_bisection(lambda t: _evaluate(func, t), x[change], x[change + 1],
+                                          tolerance=width * 1e-6)
+            blow_up = np.abs(_evaluate(func, inner)) > np.maximum(np.abs(f[change]), np.abs(f[change + 1]))
+            change = change[~blow_up]
+
+        magnitude = np.abs(f)
+        padded = np.concatenate(([np.inf], magnitude, [np.inf]))
+        local_min = (magnitude <= padded[:-2]) & (magnitude <= padded[2:]) & (magnitude <= zero_tol)
+        local_min[change] = local_min[change + 1] = False
+    return x[change], x[change + 1], x[local_min]
+
+def brent_method(func, a, b, tolerance=1e-7, max_iter=100):
+    """Brent's bracketed root finder: inverse quadratic / secant steps guarded by bisection.
+
+    Endpoint values are cached so every iteration costs exactly one call to func.
+    Returns (root, iterations, evaluations).
+    """
+    func_a, func_b = func(a), func(b)
+    evaluations = 2
+    if func_a * func_b > 0:
+        print("Brent's method cannot be applied because the signs of func(a) and func(b) are not opposite.")
+        return None, 0, evaluations
+    if func_a == 0:
+        return a, 0, evaluations
+    if func_b == 0:
+        return b, 0, evaluations
+
+    c, func_c = a, func_a
+    d = e = b - a
+    for iteration in range(max_iter):
+        if func_b * func_c > 0:
+            c, func_c = a, func_a
+            d = e = b - a
+        # Keep b as the best estimate
+        if abs(func_c) < abs(func_b):
+            a, b, c = b, c, b
+            func_a, func_b, func_c = func_b, func_c, func_b
+        tol = 2 * np.finfo(float).eps * abs(b) + tolerance / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or func_b == 0:
+            return b, iteration, evaluations
+
+        if abs(e) >= tol and abs(func_a) > abs(func_b):
+            s = func_b / func_a
+            if a == c:
+                # Secant step
+                p, q = 2 * m * s, 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q, r = func_a / func_c, func_b / func_c
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            p, q = (p, -q) if p > 0 else (-p, q)
+            # Accept the interpolation only if it stays well inside the bracket
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, func_a = b, func_b
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        func_b = func(b)
+        evaluations += 1
+
+    print("Maximum iterations reached.")
+    return b, max_iter, evaluations
+
+def batch_newton(kernel, x0, tolerance=1e-7, max_iter=100, params=()):
+    """Newton-Raphson on many independent scalar equations at once.
+
+    `kernel(x, *params)` returns (f, f') in one call, e.g. CompiledExpression.newton_kernel.
+    Elements that converge or hit a zero derivative are frozen and drop out of later
+    kernel calls. Returns (roots, iterations, converged); zero-derivative rows give NaN.
+    """
+    arrays = np.broadcast_arrays(np.asarray(x0, dtype=float), *[np.asarray(p) for p in params])
+    x = arrays[0].ravel().copy()
+    params = [p.ravel() for p in arrays[1:]]
+    iterations = np.full(x.shape, max_iter)
+    converged = np.zeros(x.shape, dtype=bool)
+    active = np.arange(x.size)
+
+    for iteration in range(max_iter):
+        if active.size == 0:
+            break
+        func_value, derivative_value = kernel(x[active], *[p[active] for p in params])
+        singular = derivative_value == 0
+        x[active[singular]], iterations[active[singular]] = np.nan, iteration
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_new = x[active] - func_value / derivative_value
+        done = ~singular & (np.abs(x_new - x[active]) < tolerance)
+        x[active[~singular]] = x_new[~singular]
+        converged[active[done]], iterations[active[done]] = True, iteration
+        active = active[~singular & ~done]
+
+    if active.size:
+        print(f"Maximum iterations reached for {active.size} element(s).")
+    shape = arrays[0].shape
+    return x.reshape(shape), iterations.reshape(shape), converged.reshape(shape)
@@ -0,0 +1,467 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from scipy.linalg import solve_banded
+from banded import TridiagonalMatrix, solve_cyclic_tridiagonal, thomas_factor, thomas_solve
+
+# Query points are evaluated in chunks of this size to bound temporary memory
+EVALUATION_CHUNK = 1 << 20
+
+# Saved splines record their boundary condition as an index into this tuple
+BOUNDARY_CONDITIONS = ("natural", "clamped", "not-a-knot", "periodic")
+
+def _second_derivative_halves(h, slopes, bc_type, end_slopes):
+    # c_i = S''(x_i) / 2 at every knot, from one O(n) tridiagonal (or cyclic) solve
+    n = len(h)
+    if bc_type == "periodic":
+        ab = np.array([np.roll(h, 1), 2 * (np.roll(h, 1) + h), h])
+        c = solve_cyclic_tridiagonal(ab, 3 * (slopes - np.roll(slopes, 1)))
+        return np.append(c, c[0])
+    rhs = 3 * np.diff(slopes)
+    if bc_type == "not-a-knot":
+        if n < 3:
+            # Three knots give the parabola through them, two knots a straight line
+            return np.full(n + 1, (slopes[1] - slopes[0]) / (h[0] + h[1]) if n == 2 else 0.0)
+        # d_0 = d_1 and d_{n-2} = d_{n-1} eliminate c_0 and c_n from the first and last interior rows
+        lower, diag, upper = h[1:-1].copy(), 2 * (h[:-1] + h[1:]), h[1:-1].copy()
+        diag[0] = (h[0] + h[1]) * (h[0] + 2 * h[1]) / h[1]
+        upper[0] = (h[1]**2 - h[0]**2) / h[1]
+        diag[-1] = (h[-2] + h[-1]) * (2 * h[-2] + h[-1]) / h[-2]
+        lower[-1] = (h[-2]**2 - h[-1]**2) / h[-2]
+        c = np.empty(n + 1)
+        c[1:n] = TridiagonalMatrix(lower, diag, upper).solve(rhs)
+        c[0] = ((h[0] + h[1]) * c[1] - h[0] * c[2]) / h[1]
+        c[n] = ((h[-2] + h[-1]) * c[n-1] - h[-1] * c[n-2]) / h[-2]
+        return c
+    if bc_type == "natural":
+        first, last = (1.0, 0.0, 0.0), (1.0, 0.0, 0.0)
+    elif bc_type == "clamped":
+        first = (2 * h[0], h[0], 3 * (slopes[0] - end_slopes[0]))
+        last = (2 * h[-1], h[-1], 3 * (end_slopes[1] - slopes[-1]))
+    else:
+        raise ValueError(f"Unknown boundary condition {bc_type!r}, expected one of {BOUNDARY_CONDITIONS}.")
+    system = TridiagonalMatrix(np.append(h[:-1], last[1]), np.concatenate(([first[0]], 2 * (h[:-1] + h[1:]), [last[0]])),
+                               np.insert(h[1:], 0, first[1]))
+    return system.solve(np.concatenate(([first[2]], rhs, [last[2]])))
+
+def cubic_spline_coefficients(x, y, bc_type="natural", end_slopes=(0.0, 0.0)):
+    """Cubic spline coefficients as a contiguous (n, 4) array of (a, b, c, d) per interval.
+
+    The c coefficients solve one O(n) tridiagonal system; on [x_i, x_{i+1}] the spline is
+    a + b t + c t^2 + d t^3 with t = x - x_i. bc_type is one of BOUNDARY_CONDITIONS;
+    "clamped" fixes the end slopes S'(x_0), S'(x_n) to end_slopes and "periodic" needs y[0] == y[-1].
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if len(x) < 2 or len(x) != len(y):
+        raise ValueError("A spline needs at least two knots and one y value per knot.")
+    h = np.diff(x)
+    if np.any(h <= 0):
+        raise ValueError("Knots must be strictly increasing.")
+    if bc_type == "periodic" and (len(x) < 3 or not np.isclose(y[0], y[-1])):
+        raise ValueError("A periodic spline needs at least three knots and y[0] == y[-1].")
+    slopes = np.diff(y) / h
+    c = _second_derivative_halves(h, slopes, bc_type, end_slopes)
+
+    coefficients = np.empty((len(h), 4))
+    coefficients[:, 0] = y[:-1]
+    coefficients[:, 1] = slopes - h * (2 * c[:-1] + c[1:]) / 3
+    coefficients[:, 2] = c[:-1]
+    coefficients[:, 3] = np.diff(c) / (3 * h)
+    return coefficients
+
+def find_intervals(x, points):
+    """Index i with x[i] <= point < x[i+1] for each point (clipped to the valid intervals).
+
+    np.searchsorted is far faster on sorted keys, so unsorted chunks are sorted first and
+    the indices scattered back.
+    """
+    if points.size < 2 or np.all(points[1:] >= points[:-1]):
+        interval = np.searchsorted(x, points, side="right")
+    else:
+        order = np.argsort(points)
+        interval = np.empty(points.shape, dtype=np.intp)
+        interval[order] = np.searchsorted(x, points[order], side="right")
+    interval -= 1
+    return np.clip(interval, 0, len(x) - 2, out=interval)
+
+def _horner(coefficients, interval, t, derivative):
+    # Value or derivative of a + b t + c t^2 + d t^3 on each query's interval
+    a, b, c, d = coefficients[interval].T
+    if derivative == 0:
+        return a + t * (b + t * (c + t * d))
+    if derivative == 1:
+        return b + t * (2 * c + 3 * t * d)
+    if derivative == 2:
+        return 2 * c + 6 * t * d
+    return 6 * d if derivative == 3 else np.zeros_like(t)
+
+def _evaluate_chunked(x, query_points, extrapolate, kernel):
+    # Shared driver: bounds check, then kernel(interval, t) per chunk of query points
+    query_points = np.asarray(query_points, dtype=float)
+    if not extrapolate and query_points.size and (query_points.min() < x[0] or query_points.max() > x[-1]):
+        raise ValueError("Query point out of bounds.")
+    flat = query_points.ravel()
+    values = np.empty(flat.shape)
+    for start in range(0, flat.size, EVALUATION_CHUNK):
+        chunk = flat[start:start + EVALUATION_CHUNK]
+        interval = find_intervals(x, chunk)
+        values[start:start + EVALUATION_CHUNK] = kernel(interval, chunk - x[interval])
+    return values.reshape(query_points.shape)
+
+def evaluate_spline(x, coefficients, query_points, extrapolate=False, derivative=0):
+    """Evaluate piecewise cubics (or their derivative) at all query points: np.searchsorted interval lookup plus Horner's rule."""
+    return _evaluate_chunked(np.asarray(x, dtype=float), query_points, extrapolate,
+                             lambda interval, t: _horner(coefficients, interval, t, derivative))
+
+def antiderivative_table(x, coefficients):
+    """Integral of the spline from x[0] to every knot, from the closed-form integral of each piece."""
+    h = np.diff(x)
+    a, b, c, d = coefficients.T
+    table = np.empty(len(x))
+    table[0] = 0.0
+    np.cumsum(h * (a + h * (b / 2 + h * (c / 3 + h * d / 4))), out=table[1:])
+    return table
+
+class CubicSpline:
+    """Cubic spline fitted once and evaluated many times.
+
+    Keeps the knots, a contiguous (n, 4) array of (a, b, c, d) per interval and the
+    antiderivative at every knot, so values, derivatives and definite integrals all cost
+    one interval lookup per query point. Periodic splines wrap queries into [x_0, x_n).
+    """
+    __slots__ = ("x", "coefficients", "antiderivative", "bc_type")
+
+    def __init__(self, x, y, bc_type="natural", end_slopes=(0.0, 0.0)):
+        self.x = np.ascontiguousarray(x, dtype=float)
+        self.coefficients = cubic_spline_coefficients(self.x, y, bc_type, end_slopes)
+        self.antiderivative = antiderivative_table(self.x, self.coefficients)
+        self.bc_type = bc_type
+
+    @classmethod
+    def from_coefficients(cls, x, coefficients, bc_type="natural", antiderivative=None):
+        """Wrap already computed knots and coefficients without refitting."""
+        spline = cls.__new__(cls)
+        spline.x, spline.coefficients, spline.bc_type = x, coefficients, bc_type
+        spline.antiderivative = antiderivative_table(x, coefficients) if antiderivative is None else antiderivative
+        return spline
+
+    @property
+    def period(self):
+        return self.x[-1] - self.x[0]
+
+    def _wrap(self, points):
+        points = np.asarray(points, dtype=float)
+        return self.x[0] + np.mod(points - self.x[0], self.period) if self.bc_type == "periodic" else points
+
+    def __call__(self, points, derivative=0, extrapolate=False):
+        """S(points), or its first, second or third derivative."""
+        return evaluate_spline(self.x, self.coefficients, self._wrap(points), extrapolate, derivative)
+
+    def derivative(self, points, order=1, extrapolate=False):
+        return self(points, order, extrapolate)
+
+    def _integral_from_start(self, points, extrapolate):
+        # Antiderivative table at the interval's knot plus the closed form over the remainder
+        def kernel(interval, t):
+            a, b, c, d = self.coefficients[interval].T
+            return self.antiderivative[interval] + t * (a + t * (b / 2 + t * (c / 3 + t * d / 4)))
+        if self.bc_type != "periodic":
+            return _evaluate_chunked(self.x, points, extrapolate, kernel)
+        periods = np.floor((np.asarray(points, dtype=float) - self.x[0]) / self.period)
+        return periods * self.antiderivative[-1] + _evaluate_chunked(self.x, self._wrap(points), True, kernel)
+
+    def integrate(self, lower, upper, extrapolate=False):
+        """Definite integral from lower to upper; both may be arrays and are broadcast together."""
+        return self._integral_from_start(upper, extrapolate) - self._integral_from_start(lower, extrapolate)
+
+    def to_array(self):
+        """(n+1, 6) table of x, a, b, c, d and the antiderivative per knot.
+
+        The last knot has no interval, so its coefficient slots hold the boundary condition
+        index into BOUNDARY_CONDITIONS followed by zeros.
+        """
+        table = np.zeros((len(self.x), 6))
+        table[:, 0] = self.x
+        table[:-1, 1:5] = self.coefficients
+        table[-1, 1] = BOUNDARY_CONDITIONS.index(self.bc_type)
+        table[:, 5] = self.antiderivative
+        return table
+
+    @classmethod
+    def from_array(cls, table):
+        x, coefficients, antiderivative = table[:, 0], table[:-1, 1:5], table[:, 5]
+        return cls.from_coefficients(x, coefficients, BOUNDARY_CONDITIONS[int(table[-1, 1])], antiderivative)
+
+    def save(self, path):
+        """Save to a .npy file that load() (or any process via np.load) can read back."""
+        np.save(path, self.to_array())
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """Load a saved spline; mmap_mode="r" lets worker processes share one copy through the page cache."""
+        table = np.load(path, mmap_mode=mmap_mode)
+        if mmap_mode is None:
+            return cls.from_coefficients(table[:, 0].copy(), np.ascontiguousarray(table[:-1, 1:5]),
+                                         BOUNDARY_CONDITIONS[int(table[-1, 1])], table[:, 5].copy())
+        return cls.from_array(table)
+
+    def __repr__(self):
+        return f"CubicSpline({len(self.x)} knots on [{self.x[0]:g}, {self.x[-1]:g}], bc_type={self.bc_type!r})"
+
+class StreamingCubicSpline:
+    """Natural cubic spline over a sliding window of the most recent `capacity` knots.
+
+    append() takes chunks of new points in increasing x. Only the last `overlap` knots and
+    the new ones are re-solved, with c at the first of them held fixed: a knot's influence
+    on c decays by at least half per knot, so far-back coefficients are unchanged to
+    rounding. Knots, y and c live in mirrored ring buffers (each value stored at i and
+    i + capacity), so the window is always one contiguous slice and memory stays at
+    3 * 2 * capacity floats however long the stream runs.
+    """
+    __slots__ = ("capacity", "overlap", "_x", "_y", "_c", "_count", "_total")
+
+    def __init__(self, capacity=4096, overlap=64):
+        if capacity < 2 or not 0 < overlap < capacity:
+            raise ValueError("Need capacity >= 2 and 0 < overlap < capacity.")
+        self.capacity, self.overlap = capacity, overlap
+        self._x, self._y, self._c = np.empty(2 * capacity), np.empty(2 * capacity), np.empty(2 * capacity)
+        self._count = self._total = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def x(self):
+        start = (self._total - self._count) % self.capacity
+        return self._x[start:start + self._count]
+
+    @property
+    def y(self):
+        start = (self._total - self._count) % self.capacity
+        return self._y[start:start + self._count]
+
+    @property
+    def c(self):
+        start = (self._total - self._count) % self.capacity
+        return self._c[start:start + self._count]
+
+    def _write_tail(self, x, y, c):
+        # Overwrite the last len(x) knots of the window, in both halves of the mirror
+        position = (self._total - len(x) + np.arange(len(x))) % self.capacity
+        for buffer, values in ((self._x, x), (self._y, y), (self._c, c)):
+            buffer[position] = values
+            buffer[position + self.capacity] = values
+
+    def append(self, x_new, y_new):
+        """Add a chunk of points, re-solving only the tail of the tridiagonal system."""
+        x_new, y_new = np.atleast_1d(np.asarray(x_new, dtype=float)), np.atleast_1d(np.asarray(y_new, dtype=float))
+        if x_new.shape != y_new.shape or x_new.ndim != 1:
+            raise ValueError("x and y chunks must be 1D arrays of the same length.")
+        if not x_new.size:
+            return
+        keep = min(self.overlap, self._count)
+        x = np.concatenate((self.x[self._count - keep:], x_new))
+        y = np.concatenate((self.y[self._count - keep:], y_new))
+        h = np.diff(x)
+        if np.any(h <= 0):
+            raise ValueError("Knots must be strictly increasing across chunks.")
+
+        # c at the first local knot is held fixed (0 for the very first knot), c at the newest knot is 0
+        c = np.zeros(len(x))
+        if keep:
+            c[0] = self.c[self._count - keep]
+        if len(x) > 2:
+            slopes = np.diff(y) / h
+            rhs = 3 * np.diff(slopes)
+            rhs[0] -= h[0] * c[0]
+            # The local system is small, so one LAPACK banded call beats the vectorized Thomas sweep
+            system = TridiagonalMatrix(h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1])
+            c[1:-1] = solve_banded((1, 1), system.to_band(), rhs, check_finite=False)
+
+        self._total += len(x_new)
+        self._count = min(self._count + len(x_new), self.capacity)
+        tail = min(len(x), self._count)
+        self._write_tail(x[-tail:], y[-tail:], c[-tail:])
+
+    def _kernel(self, x, y, c, derivative):
+        # Coefficients of just the queried intervals, from the knot values
+        def kernel(interval, t):
+            h = x[interval + 1] - x[interval]
+            c0, c1 = c[interval], c[interval + 1]
+            pieces = np.stack((y[interval], (y[interval + 1] - y[interval]) / h - h * (2 * c0 + c1) / 3,
+                               c0, (c1 - c0) / (3 * h)), axis=1)
+            return _horner(pieces, slice(None), t, derivative)
+        return kernel
+
+    def __call__(self, points, derivative=0, extrapolate=False):
+        """Evaluate the current window's spline (or a derivative) without any refit."""
+        if self._count < 2:
+            raise ValueError("The stream needs at least two knots before it can be evaluated.")
+        x = self.x
+        return _evaluate_chunked(x, points, extrapolate, self._kernel(x, self.y, self.c, derivative))
+
+    def to_spline(self):
+        """Snapshot of the current window as a CubicSpline."""
+        x, y, c = self.x.copy(), self.y, self.c
+        h = np.diff(x)
+        coefficients = np.empty((len(h), 4))
+        coefficients[:, 0] = y[:-1]
+        coefficients[:, 1] = np.diff(y) / h - h * (2 * c[:-1] + c[1:]) / 3
+        coefficients[:, 2] = c[:-1]
+        coefficients[:, 3] = np.diff(c) / (3 * h)
+        return CubicSpline.from_coefficients(x, coefficients)
+
+def _natural_factor(h):
+    # Factor of the natural-end system for the interior second derivatives, or None for two knots
+    if len(h) < 2:
+        return None
+    return thomas_factor(h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1])
+
+def _natural_second_derivatives(factor, h, values):
+    # S'' at every knot along the last axis of values, all rows in one multi-right-hand-side solve
+    second = np.zeros(values.shape)
+    if factor is not None:
+        slopes = np.diff(values, axis=-1) / h
+        thomas_solve(factor, 6 * np.diff(slopes, axis=-1), out=second[..., 1:-1])
+    return second
+
+def _hermite_weights(knots, h, points):
+    # Interval index and the weights of (S_i, S_{i+1}, S''_i, S''_{i+1}) at each point
+    interval = find_intervals(knots, points)
+    step = h[interval]
+    u = (points - knots[interval]) / step
+    v = 1 - u
+    return interval, (v, u, (v**3 - v) * step**2 / 6, (u**3 - u) * step**2 / 6)
+
+class BicubicSpline:
+    """Tensor-product natural bicubic spline on a rectilinear grid, z[j, i] = f(x[i], y[j]).
+
+    Each axis's tridiagonal system is factored once. z_xx (all rows), z_yy and z_xxyy
+    (all columns) then come from multi-right-hand-side solves, stored with z as one
+    (ny, nx, 4) table. A query gathers its cell's four corners in one indexing operation.
+    """
+    __slots__ = ("x", "y", "table")
+
+    def __init__(self, x, y, z):
+        self.x, self.y = np.ascontiguousarray(x, dtype=float), np.ascontiguousarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        if z.shape != (len(self.y), len(self.x)):
+            raise ValueError(f"z must have shape (len(y), len(x)) = {(len(self.y), len(self.x))}, got {z.shape}.")
+        hx, hy = np.diff(self.x), np.diff(self.y)
+        if len(hx) < 1 or len(hy) < 1 or np.any(hx <= 0) or np.any(hy <= 0):
+            raise ValueError("Grid knots must be strictly increasing with at least two per axis.")
+        x_factor, y_factor = _natural_factor(hx), _natural_factor(hy)
+
+        self.table = np.empty(z.shape + (4,))
+        self.table[..., 0] = z
+        self.table[..., 1] = z_xx = _natural_second_derivatives(x_factor, hx, z)
+        self.table[..., 2] = _natural_second_derivatives(y_factor, hy, z.T).T
+        self.table[..., 3] = _natural_second_derivatives(y_factor, hy, z_xx.T).T
+
+    @property
+    def shape(self):
+        return self.table.shape[:2]
+
+    def __call__(self, x_points, y_points, extrapolate=False):
+        """Evaluate at scattered points; x_points and y_points are broadcast together."""
+        x_points, y_points = np.broadcast_arrays(np.asarray(x_points, dtype=float), np.asarray(y_points, dtype=float))
+        if not extrapolate and x_points.size and (x_points.min() < self.x[0] or x_points.max() > self.x[-1]
+                                                  or y_points.min() < self.y[0] or y_points.max() > self.y[-1]):
+            raise ValueError("Query point out of bounds.")
+        hx, hy = np.diff(self.x), np.diff(self.y)
+        flat_x, flat_y = x_points.ravel(), y_points.ravel()
+        values = np.empty(flat_x.shape)
+        for start in range(0, flat_x.size, EVALUATION_CHUNK):
+            window = slice(start, start + EVALUATION_CHUNK)
+            ix, wx = _hermite_weights(self.x, hx, flat_x[window])
+            iy, wy = _hermite_weights(self.y, hy, flat_y[window])
+            total = 0.0
+            for j in (0, 1):
+                for i in (0, 1):
+                    corner = self.table[iy + j, ix + i]
+                    total = total + (wy[j] * (wx[i] * corner[:, 0] + wx[i + 2] * corner[:, 1])
+                                     + wy[j + 2] * (wx[i] * corner[:, 2] + wx[i + 2] * corner[:, 3]))
+            values[window] = total
+        return values.reshape(x_points.shape)
+
+    def grid(self, x_points, y_points, extrapolate=False):
+        """Values on the meshgrid of x_points and y_points, shape (len(y_points), len(x_points)).
+
+        The spline is separable, so interval lookup and weights are computed once per axis
+        and only the corner gathers are two-dimensional.
+        """
+        x_points, y_points = np.asarray(x_points, dtype=float), np.asarray(y_points, dtype=float)
+        if not extrapolate and x_points.size and y_points.size and (
+                x_points.min() < self.x[0] or x_points.max() > self.x[-1]
+                or y_points.min() < self.y[0] or y_points.max() > self.y[-1]):
+            raise ValueError("Query point out of bounds.")
+        ix, wx = _hermite_weights(self.x, np.diff(self.x), x_points)
+        iy, wy = _hermite_weights(self.y, np.diff(self.y), y_points)
+        values = np.zeros((len(y_points), len(x_points)))
+        for j in (0, 1):
+            for i in (0, 1):
+                corner = self.table[(iy + j)[:, None], ix + i]
+                values += wy[j][:, None] * (wx[i] * corner[..., 0] + wx[i + 2] * corner[..., 1])
+                values += wy[j + 2][:, None] * (wx[i] * corner[..., 2] + wx[i + 2] * corner[..., 3])
+        return values
+
+def evaluate_grid_to_file(spline, x_points, y_points, path, tile_size=512, workers=None):
+    """Evaluate spline.grid over the meshgrid of x_points and y_points straight into a .npy file.
+
+    The output is an np.memmap opened with np.lib.format.open_memmap, filled one
+    tile_size x tile_size tile at a time, so peak memory grows with tile_size and workers,
+    not with the grid. Tiles are disjoint and run on a thread pool. Returns the memmap.
+    """
+    x_points, y_points = np.asarray(x_points, dtype=float), np.asarray(y_points, dtype=float)
+    output = np.lib.format.open_memmap(path, mode="w+", dtype=float, shape=(len(y_points), len(x_points)))
+
+    def fill(tile):
+        rows, cols = tile
+        output[rows, cols] = spline.grid(x_points[cols], y_points[rows])
+    tiles = [(slice(row, row + tile_size), slice(col, col + tile_size))
+             for row in range(0, len(y_points), tile_size) for col in range(0, len(x_points), tile_size)]
+    with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+        list(pool.map(fill, tiles))
+    output.flush()
+    return output
+
+def benchmark_spline(num_knots=10**6, num_queries=10**7, seed=0):
+    """Time O(n) construction and vectorized evaluation on num_knots knots and num_queries queries."""
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.uniform(0.5, 1.5, num_knots))
+    y = np.sin(x / 10)
+    query_points = rng.uniform(x[0], x[-1], num_queries)
+
+    start = time.perf_counter()
+    coefficients = cubic_spline_coefficients(x, y)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    values = evaluate_spline(x, coefficients, query_points)
+    evaluation_time = time.perf_counter() - start
+    print(f"Built a {num_knots}-knot spline in {build_time:.3f} s, "
+          f"evaluated {num_queries} queries in {evaluation_time:.3f} s "
+          f"(max |S - sin| = {np.abs(values - np.sin(query_points / 10)).max():.2e})")
+    return build_time, evaluation_time
+
+def benchmark_bicubic(grid_size=2000, num_queries=10**6, seed=0):
+    """Time fitting a grid_size x grid_size bicubic spline and evaluating num_queries scattered points."""
+    rng = np.random.default_rng(seed)
+    x, y = np.sort(rng.uniform(0, 10, grid_size)), np.sort(rng.uniform(0, 10, grid_size))
+    z = np.sin(x)[None, :] * np.cos(y)[:, None]
+    x_points, y_points = rng.uniform(x[0], x[-1], num_queries), rng.uniform(y[0], y[-1], num_queries)
+
+    start = time.perf_counter()
+    spline = BicubicSpline(x, y, z)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    values = spline(x_points, y_points)
+    evaluation_time = time.perf_counter() - start
+    print(f"Built a {grid_size}x{grid_size} bicubic spline in {build_time:.3f} s, "
+          f"evaluated {num_queries} scattered queries in {evaluation_time:.3f} s "
+          f"(max |S - f| = {np.abs(values - np.sin(x_points) * np.cos(y_points)).max():.2e})")
+    return build_time, evaluation_time
+
+if __name__ == "__main__":
+    benchmark_spline()
+    benchmark_bicubic()
@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+from banded import partitioned_thomas
+
+@pytest.mark.parametrize("n", [1, 2, 3])
+@pytest.mark.parametrize("num_blocks", [None, 1, 2])
+def test_partitioned_thomas_small_systems(n, num_blocks):
+    rng = np.random.default_rng(n)
+    a, c = rng.uniform(-1, 1, n - 1), rng.uniform(-1, 1, n - 1)
+    b, d = rng.uniform(3, 4, n), rng.normal(size=n)
+    A = np.diag(b) + np.diag(a, -1) + np.diag(c, 1)
+    x = partitioned_thomas(a, b, c, d, num_blocks=num_blocks, workers=2)
+    np.testing.assert_allclose(x, np.linalg.solve(A, d), rtol=1e-12, atol=1e-12)
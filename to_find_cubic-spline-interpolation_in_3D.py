@@ -1,36 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from splines import BicubicSpline, evaluate_grid_to_file
 
 def cubic_spline_3d(x, y, z, query_points_x, query_points_y):
+    # z[j, i] is the value at (x[i], y[j]); both axes are fitted once as one tensor-product spline
+    spline = BicubicSpline(x, y, z)
     X, Y = np.meshgrid(query_points_x, query_points_y)
-    def cubic_spline_1d(x_vals, y_vals, query_points):
-        n = len(x_vals) - 1
-        h = np.diff(x_vals)
-        A = np.zeros((n + 1, n + 1))
-        b = np.zeros(n + 1)
-        A[0, 0] = 1
-        A[n, n] = 1
-        for i in range(1, n):
-            A[i, i - 1] = h[i - 1]
-            A[i, i] = 2 * (h[i - 1] + h[i])
-            A[i, i + 1] = h[i]
-            b[i] = 3 * ((y_vals[i + 1] - y_vals[i]) / h[i] - (y_vals[i] - y_vals[i - 1]) / h[i - 1])
-        M = np.linalg.solve(A, b)
-        def evaluate_spline(xi):
-            for i in range(n):
-                if x_vals[i] <= xi <= x_vals[i + 1]:
-                    a = y_vals[i]
-                    b = (y_vals[i + 1] - y_vals[i]) / h[i] - h[i] * (2 * M[i] + M[i + 1]) / 3
-                    c = M[i] / 2
-                    d = (M[i + 1] - M[i]) / (3 * h[i])
-                    dx = xi - x_vals[i]
-                    return a + b * dx + c * dx**2 + d * dx**3
-            raise ValueError("Query point out of bounds.")
-
-        return np.array([evaluate_spline(xi) for xi in query_points])
-    interpolated_z = np.array([cubic_spline_1d(x, z_row, query_points_x) for z_row in z])
-    interpolated_z_final = np.array([cubic_spline_1d(y, interpolated_z[:, i], query_points_y) for i in range(len(query_points_x))])
+    interpolated_z_final = spline(X, Y)
     return X, Y, interpolated_z_final
 def get_input():
     while True:
@@ -69,7 +46,7 @@ def get_input():
                 print("\nGenerated random data points:")
                 for i in range(n):
                     for j in range(n):
-                        print(f"x[{i}] = {x[i]:.2f}, y[{j}] = {y[j]:.2f}, z[{i},{j}] = {z[i,j]:.2f}")
+                        print(f"x[{i}] = {x[i]:.2f}, y[{j}] = {y[j]:.2f}, z[{j},{i}] = {z[j,i]:.2f}")
             else:
                 print("Invalid choice! Please enter 1 or 2.")
                 continue
@@ -97,16 +74,22 @@ def main():
 
         query_points_x = np.linspace(min(x), max(x), num_query_points)
         query_points_y = np.linspace(min(y), max(y), num_query_points)
-        X, Y, interpolated_z = cubic_spline_3d(x, y, z, query_points_x, query_points_y)
-        print("\nInterpolation complete. Plotting 3D surface...")
-        fig = plt.figure(figsize=(10, 7))
-        ax = fig.add_subplot(111, projection='3d')
-        ax.plot_surface(X, Y, interpolated_z, cmap='viridis', edgecolor='none')
-        ax.set_xlabel('X')
-        ax.set_ylabel('Y')
-        ax.set_zlabel('Z')
-        ax.set_title('3D Cubic Spline Interpolation')
-        plt.show()
+        output_path = input("\nEnter a .npy file to write the surface to tile by tile (leave empty to plot): ").strip()
+        if output_path:
+            # Large grids: never hold X, Y or the full surface in memory
+            surface = evaluate_grid_to_file(BicubicSpline(x, y, z), query_points_x, query_points_y, output_path)
+            print(f"Wrote a {surface.shape[0]}x{surface.shape[1]} surface to {output_path}.")
+        else:
+            X, Y, interpolated_z = cubic_spline_3d(x, y, z, query_points_x, query_points_y)
+            print("\nInterpolation complete. Plotting 3D surface...")
+            fig = plt.figure(figsize=(10, 7))
+            ax = fig.add_subplot(111, projection='3d')
+            ax.plot_surface(X, Y, interpolated_z, cmap='viridis', edgecolor='none')
+            ax.set_xlabel('X')
+            ax.set_ylabel('Y')
+            ax.set_zlabel('Z')
+            ax.set_title('3D Cubic Spline Interpolation')
+            plt.show()
         repeat = input("\nDo you want to run the program again? (yes/no): ").strip().lower()
         if repeat not in ('yes', 'y'):
             print("Goodbye!")
@@ -0,0 +1,48 @@
+import numpy as np
+from tabulate import tabulate
+
+class IterationTrace:
+    """Preallocated ring buffer of iteration records; keeps the most recent `capacity` of them.
+
+    Solvers take an optional `trace` callable and call trace(*record) once per step, so an
+    IterationTrace or any plain callback can be passed. Solvers skip all tracing work when
+    trace is None.
+    """
+    __slots__ = ("capacity", "_records", "_count")
+
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self._records = [None] * capacity
+        self._count = 0
+
+    def __call__(self, *record):
+        self._records[self._count % self.capacity] = record
+        self._count += 1
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def dropped(self):
+        """Number of oldest records overwritten because the buffer was full."""
+        return max(self._count - self.capacity, 0)
+
+    def records(self):
+        if self._count <= self.capacity:
+            return self._records[:self._count]
+        start = self._count % self.capacity
+        return self._records[start:] + self._records[:start]
+
+    def clear(self):
+        self._records = [None] * self.capacity
+        self._count = 0
+
+def render_trace(records, headers=(), tablefmt="fancy_grid", floatfmt=".6f"):
+    """Render trace records as a table; array fields are spread over several columns."""
+    rows = []
+    for record in records:
+        row = []
+        for field in record:
+            row.extend(np.ravel(field).tolist() if isinstance(field, np.ndarray) else [field])
+        rows.append(row)
+    return tabulate(rows, headers=headers, tablefmt=tablefmt, floatfmt=floatfmt)